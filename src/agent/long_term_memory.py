@@ -4,20 +4,81 @@ from __future__ import annotations
 대화 요약, 사용자 정보, 중요 메모 저장/조회
 """
 import aiosqlite
+import asyncio
 import json
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 DB_PATH = Path(__file__).parent.parent.parent / "memory" / "conversations" / "chat.db"
 
+# 행 구성 루프에서 행마다 재사용되는 딕셔너리 키 (intern → 포인터 비교 조회)
+_K_KEY = sys.intern("key")
+_K_VALUE = sys.intern("value")
+_K_UPDATED_AT = sys.intern("updated_at")
+_K_ID = sys.intern("id")
+_K_CONTENT = sys.intern("content")
+_K_TAGS = sys.intern("tags")
+_K_CREATED_AT = sys.intern("created_at")
+
+
+@dataclass
+class _UserCache:
+    """사용자별 인메모리 캐시 — 컬럼별 병렬 리스트 (SQLite 왕복 제거)
+
+    facts/notes 각각 첫 조회 시 한 번 로드하고, 쓰기 시 해당 사용자
+    엔트리를 무효화한다. 검색은 평탄한 리스트를 순회하므로 행 단위
+    row-factory 오버헤드가 없다.
+    """
+    fact_keys: list[str] = field(default_factory=list)
+    fact_values: list[str] = field(default_factory=list)
+    fact_updated: list[str] = field(default_factory=list)
+    facts_loaded: bool = False
+
+    note_ids: list[int] = field(default_factory=list)
+    note_contents: list[str] = field(default_factory=list)
+    note_tags: list[list[str]] = field(default_factory=list)
+    note_created: list[str] = field(default_factory=list)
+    notes_loaded: bool = False
+
 
 class LongTermMemory:
     """장기 기억 관리 — 요약, 사용자 정보, 메모"""
 
+    # 쓰기 배치 설정 — 커밋(fsync)을 호출당 1회에서 배치당 1회로 줄인다
+    FLUSH_BATCH = 100
+    FLUSH_WINDOW = 0.05  # 초
+
+    _FACT_UPSERT_SQL = (
+        "INSERT INTO user_facts (user_id, key, value, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(user_id, key) DO UPDATE SET value = ?, updated_at = ?"
+    )
+    _NOTE_INSERT_SQL = (
+        "INSERT INTO important_notes (user_id, content, tags, created_at) "
+        "VALUES (?, ?, ?, ?)"
+    )
+
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self.db: Optional[aiosqlite.Connection] = None
+        self._user_cache: dict[str, _UserCache] = {}
+        self._write_queue: asyncio.Queue[tuple[str, tuple]] = asyncio.Queue()
+        # 플러시 루프가 윈도우 동안 들고 있는 선두 항목들 — flush()가 큐만
+        # 비우면 이 항목들보다 늦게 들어온 쓰기가 먼저 커밋되어 같은 키의
+        # 새 값이 옛 값으로 덮일 수 있으므로, 여기서 함께 회수한다
+        self._held_batch: list[tuple[str, tuple]] = []
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _cache(self, user_id: str) -> _UserCache:
+        """사용자 캐시 엔트리 조회 (없으면 생성)"""
+        cache = self._user_cache.get(user_id)
+        if cache is None:
+            cache = self._user_cache[user_id] = _UserCache()
+        return cache
 
     async def init(self):
         """DB 초기화 — 장기 기억 테이블 생성"""
@@ -72,12 +133,79 @@ class LongTermMemory:
         """)
 
         await self.db.commit()
+        self._flush_task = asyncio.create_task(self._flush_loop())
 
     async def close(self):
-        """DB 연결 닫기"""
+        """DB 연결 닫기 (대기 중인 쓰기 반영 후)"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
         if self.db:
+            await self.flush()
             await self.db.close()
 
+    # --- 쓰기 배치 ---
+
+    def _drain_pending(self, limit: Optional[int] = None) -> list[tuple[str, tuple]]:
+        """들고 있던 선두 항목 + 큐의 항목을 도착 순서(FIFO) 그대로 회수"""
+        # 리스트 객체를 교체하지 않고 제자리에서 비운다 — 플러시 루프가
+        # 같은 객체를 계속 참조하므로, 교체하면 루프가 버려진 리스트에
+        # 항목을 넣어 그 쓰기가 영영 커밋되지 않는다
+        batch = list(self._held_batch)
+        self._held_batch.clear()
+        while limit is None or len(batch) < limit:
+            try:
+                batch.append(self._write_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush_loop(self):
+        """백그라운드 플러시 — 짧은 윈도우 동안 쓰기를 모아 한 트랜잭션으로 커밋"""
+        while True:
+            # await를 먼저 끝낸 뒤 append — 표현식 안에서 await하면 대기 중
+            # flush()가 끼어들었을 때 이전 리스트 객체에 append하게 된다
+            item = await self._write_queue.get()
+            self._held_batch.append(item)
+            try:
+                await asyncio.sleep(self.FLUSH_WINDOW)
+            except asyncio.CancelledError:
+                batch = self._drain_pending()
+                if batch:
+                    await self._write_batch(batch)
+                raise
+            # 윈도우 중 flush()가 먼저 회수했다면 여기서는 쓸 것이 없다
+            batch = self._drain_pending(self.FLUSH_BATCH)
+            if batch:
+                await self._write_batch(batch)
+
+    async def _write_batch(self, batch: list[tuple[str, tuple]]):
+        """배치를 종류별로 묶어 executemany + 단일 커밋"""
+        facts = [row for kind, row in batch if kind == "fact"]
+        notes = [row for kind, row in batch if kind == "note"]
+        async with self._write_lock:
+            if facts:
+                await self.db.executemany(self._FACT_UPSERT_SQL, facts)
+            if notes:
+                await self.db.executemany(self._NOTE_INSERT_SQL, notes)
+            await self.db.commit()
+
+    async def flush(self):
+        """대기 중인 쓰기를 즉시 DB에 반영 (읽기 전/종료 시 호출)
+
+        플러시 루프가 윈도우 동안 들고 있는 배치까지 함께 회수하므로
+        같은 키에 대한 쓰기는 항상 도착 순서대로 커밋된다.
+        """
+        if not self.db:
+            return
+        batch = self._drain_pending()
+        if batch:
+            await self._write_batch(batch)
+
     # --- 요약 ---
 
     async def save_summary(
@@ -117,34 +245,42 @@ class LongTermMemory:
     # --- 사용자 정보 ---
 
     async def save_fact(self, user_id: str, key: str, value: str):
-        """사용자 정보 저장 (upsert)"""
+        """사용자 정보 저장 (upsert) — 플러시 큐에 적재 후 즉시 반환"""
         if not self.db:
             return
         now = datetime.now().isoformat()
-        await self.db.execute(
-            "INSERT INTO user_facts (user_id, key, value, created_at, updated_at) "
-            "VALUES (?, ?, ?, ?, ?) "
-            "ON CONFLICT(user_id, key) DO UPDATE SET value = ?, updated_at = ?",
-            (user_id, key, value, now, now, value, now),
+        self._write_queue.put_nowait(
+            ("fact", (user_id, key, value, now, now, value, now))
         )
-        await self.db.commit()
+        self._user_cache.pop(user_id, None)
 
     async def get_facts(self, user_id: str) -> list[dict]:
-        """사용자 정보 전체 조회"""
+        """사용자 정보 전체 조회 (캐시 우선)"""
         if not self.db:
             return []
-        cursor = await self.db.execute(
-            "SELECT key, value, updated_at FROM user_facts "
-            "WHERE user_id = ? ORDER BY updated_at DESC",
-            (user_id,),
-        )
-        rows = await cursor.fetchall()
-        return [{"key": r[0], "value": r[1], "updated_at": r[2]} for r in rows]
+        cache = self._cache(user_id)
+        if not cache.facts_loaded:
+            await self.flush()
+            cursor = await self.db.execute(
+                "SELECT key, value, updated_at FROM user_facts "
+                "WHERE user_id = ? ORDER BY updated_at DESC",
+                (user_id,),
+            )
+            rows = await cursor.fetchall()
+            cache.fact_keys = [r[0] for r in rows]
+            cache.fact_values = [r[1] for r in rows]
+            cache.fact_updated = [r[2] for r in rows]
+            cache.facts_loaded = True
+        return [
+            {_K_KEY: k, _K_VALUE: v, _K_UPDATED_AT: u}
+            for k, v, u in zip(cache.fact_keys, cache.fact_values, cache.fact_updated)
+        ]
 
     async def get_fact(self, user_id: str, key: str) -> Optional[str]:
         """특정 키의 사용자 정보 조회"""
         if not self.db:
             return None
+        await self.flush()
         cursor = await self.db.execute(
             "SELECT value FROM user_facts WHERE user_id = ? AND key = ?",
             (user_id, key),
@@ -160,47 +296,50 @@ class LongTermMemory:
             return
         now = datetime.now().isoformat()
         tags_json = json.dumps(tags or [], ensure_ascii=False)
-        await self.db.execute(
-            "INSERT INTO important_notes (user_id, content, tags, created_at) "
-            "VALUES (?, ?, ?, ?)",
-            (user_id, content, tags_json, now),
-        )
-        await self.db.commit()
-
-    async def search_notes(self, user_id: str, query: str = "", tag: str = "") -> list[dict]:
-        """메모 검색 — 내용 또는 태그로 검색"""
-        if not self.db:
-            return []
+        self._write_queue.put_nowait(("note", (user_id, content, tags_json, now)))
+        self._user_cache.pop(user_id, None)
 
-        if tag:
-            # 태그 검색 (JSON 배열 내 포함 여부)
-            cursor = await self.db.execute(
-                "SELECT id, content, tags, created_at FROM important_notes "
-                "WHERE user_id = ? AND tags LIKE ? ORDER BY created_at DESC LIMIT 20",
-                (user_id, f"%{tag}%"),
-            )
-        elif query:
-            # 내용 검색
-            cursor = await self.db.execute(
-                "SELECT id, content, tags, created_at FROM important_notes "
-                "WHERE user_id = ? AND content LIKE ? ORDER BY created_at DESC LIMIT 20",
-                (user_id, f"%{query}%"),
-            )
-        else:
-            # 최근 메모 전체
+    async def _load_notes(self, user_id: str) -> _UserCache:
+        """사용자의 전체 메모를 캐시에 적재 (최신순)"""
+        cache = self._cache(user_id)
+        if not cache.notes_loaded:
+            await self.flush()
             cursor = await self.db.execute(
                 "SELECT id, content, tags, created_at FROM important_notes "
-                "WHERE user_id = ? ORDER BY created_at DESC LIMIT 20",
+                "WHERE user_id = ? ORDER BY created_at DESC",
                 (user_id,),
             )
+            rows = await cursor.fetchall()
+            cache.note_ids = [r[0] for r in rows]
+            cache.note_contents = [r[1] for r in rows]
+            cache.note_tags = [json.loads(r[2]) for r in rows]
+            cache.note_created = [r[3] for r in rows]
+            cache.notes_loaded = True
+        return cache
 
-        rows = await cursor.fetchall()
-        return [
-            {
-                "id": r[0],
-                "content": r[1],
-                "tags": json.loads(r[2]),
-                "created_at": r[3],
-            }
-            for r in rows
-        ]
+    async def search_notes(self, user_id: str, query: str = "", tag: str = "") -> list[dict]:
+        """메모 검색 — 내용 또는 태그로 검색 (캐시 스캔)"""
+        if not self.db:
+            return []
+
+        cache = await self._load_notes(user_id)
+
+        results: list[dict] = []
+        for i, content in enumerate(cache.note_contents):
+            if tag:
+                if not any(tag in t for t in cache.note_tags[i]):
+                    continue
+            elif query:
+                if query not in content:
+                    continue
+            results.append(
+                {
+                    _K_ID: cache.note_ids[i],
+                    _K_CONTENT: content,
+                    _K_TAGS: cache.note_tags[i],
+                    _K_CREATED_AT: cache.note_created[i],
+                }
+            )
+            if len(results) >= 20:
+                break
+        return results
@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 import math
 import json
+import sys
 from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
@@ -21,6 +22,18 @@ PAGE_CHAR_MAP = {
 # 평균 읽기 속도 (한국어 글자/분)
 READING_SPEED_KO = 500
 
+# ── 모듈 수준 컴파일 패턴 (호출마다 re 캐시 조회 비용 제거) ──
+_SENT_RE = re.compile(r"[.!?。！？]+")
+_INDEX_WORD_RE = re.compile(r"[가-힣]{2,}|[a-zA-Z]{3,}")
+
+# 참고문헌 일괄 로드 루프에서 항목마다 조회되는 키 (intern → 포인터 비교)
+(_K_ID, _K_REF_ID, _K_AUTHORS, _K_TITLE, _K_YEAR,
+ _K_PUBLISHER, _K_JOURNAL, _K_VOLUME, _K_PAGES, _K_URL) = (
+    sys.intern(k)
+    for k in ("id", "ref_id", "authors", "title", "year",
+              "publisher", "journal", "volume", "pages", "url")
+)
+
 
 @dataclass
 class ManuscriptStats:
@@ -111,14 +124,12 @@ class Reference:
             base += f" {self.url}."
         return base
 
+    # 스타일 디스패치 테이블 — 클래스 정의 시 1회 구성 (호출마다 dict 생성 제거)
+    _FORMATTERS = {"apa": format_apa, "chicago": format_chicago, "mla": format_mla}
+
     def format(self, style: str = "apa") -> str:
-        formatters = {
-            "apa": self.format_apa,
-            "chicago": self.format_chicago,
-            "mla": self.format_mla,
-        }
-        formatter = formatters.get(style.lower(), self.format_apa)
-        return formatter()
+        formatter = self._FORMATTERS.get(style.lower(), Reference.format_apa)
+        return formatter(self)
 
 
 class ManuscriptAnalyzer:
@@ -155,7 +166,7 @@ class ManuscriptAnalyzer:
         stats.total_chars = len(text)
         stats.chars_no_space = len(text.replace(" ", "").replace("\t", "").replace("\n", ""))
         stats.word_count = len(text.split())
-        stats.sentence_count = len(re.findall(r"[.!?。！？]+", text))
+        stats.sentence_count = len(_SENT_RE.findall(text))
         if stats.sentence_count == 0 and text.strip():
             stats.sentence_count = 1
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
@@ -215,6 +226,22 @@ class ManuscriptAnalyzer:
         """참고문헌 추가"""
         self._references[ref.ref_id] = ref
 
+    def add_reference_dict(self, item: dict) -> Reference:
+        """딕셔너리 하나를 Reference로 변환하여 바로 등록 (리스트 순회 생략)"""
+        ref = Reference(
+            ref_id=item.get(_K_ID, item.get(_K_REF_ID, f"ref_{len(self._references)}")),
+            authors=item.get(_K_AUTHORS, []),
+            title=item.get(_K_TITLE, ""),
+            year=item.get(_K_YEAR, 0),
+            publisher=item.get(_K_PUBLISHER, ""),
+            journal=item.get(_K_JOURNAL, ""),
+            volume=item.get(_K_VOLUME, ""),
+            pages=item.get(_K_PAGES, ""),
+            url=item.get(_K_URL, ""),
+        )
+        self._references[ref.ref_id] = ref
+        return ref
+
     def get_reference(self, ref_id: str) -> Optional[Reference]:
         """참고문헌 조회"""
         return self._references.get(ref_id)
@@ -222,24 +249,15 @@ class ManuscriptAnalyzer:
     def list_references(self, style: str = "apa") -> list[str]:
         """모든 참고문헌을 지정 스타일로 포맷팅하여 반환"""
         refs = sorted(self._references.values(), key=lambda r: (r.authors[0] if r.authors else "", r.year))
-        return [ref.format(style) for ref in refs]
+        # 스타일 디스패치를 루프 밖에서 한 번만 해석
+        formatter = Reference._FORMATTERS.get(style.lower(), Reference.format_apa)
+        return [formatter(ref) for ref in refs]
 
     def load_references(self, data: list[dict]) -> int:
         """JSON 딕셔너리 리스트에서 참고문헌 일괄 로드"""
         count = 0
         for item in data:
-            ref = Reference(
-                ref_id=item.get("id", item.get("ref_id", f"ref_{count}")),
-                authors=item.get("authors", []),
-                title=item.get("title", ""),
-                year=item.get("year", 0),
-                publisher=item.get("publisher", ""),
-                journal=item.get("journal", ""),
-                volume=item.get("volume", ""),
-                pages=item.get("pages", ""),
-                url=item.get("url", ""),
-            )
-            self.add_reference(ref)
+            self.add_reference_dict(item)
             count += 1
         return count
 
@@ -250,7 +268,7 @@ class ManuscriptAnalyzer:
     ) -> list[tuple[str, int]]:
         """주요 키워드 빈도 분석으로 색인 항목 생성"""
         # 한국어 + 영어 단어 추출
-        words = re.findall(r"[가-힣]{2,}|[a-zA-Z]{3,}", text)
+        words = _INDEX_WORD_RE.findall(text)
         words_lower = [w.lower() for w in words]
 
         # 불용어 제거
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import difflib
 import hashlib
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -11,6 +12,54 @@ import aiosqlite
 
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "mintobot.db"
 
+_HUNK_RE = re.compile(r"^@@ -(\d+)((?:,\d+)?) \+(\d+)((?:,\d+)?) @@")
+
+
+def _trimmed_unified_diff(
+    a_lines: List[str],
+    b_lines: List[str],
+    fromfile: str,
+    tofile: str,
+    context: int = 3,
+) -> List[str]:
+    """공통 접두/접미 행을 잘라낸 뒤 unified diff 수행
+
+    퇴고는 대부분 국소 수정이라 두 버전의 앞뒤가 거의 같다 — 먼저 선형
+    스캔으로 공통 구간을 걷어내면 diff 비용이 전체 길이가 아니라 변경
+    구간 크기에 비례한다. 문맥 행(context)은 남겨 두고, 잘려나간 행 수만큼
+    헝크 헤더의 행 번호를 보정한다. SequenceMatcher가 잘린 입력에서 다른
+    동점 경로를 고를 수 있어 전체 diff와 바이트 단위로 같지는 않지만,
+    행 번호가 올바른 동등한 diff가 나온다.
+    """
+    n = min(len(a_lines), len(b_lines))
+    pre = 0
+    while pre < n and a_lines[pre] == b_lines[pre]:
+        pre += 1
+    if pre == len(a_lines) == len(b_lines):
+        return []
+    post = 0
+    while post < n - pre and a_lines[-1 - post] == b_lines[-1 - post]:
+        post += 1
+    pre = max(0, pre - context)
+    post = max(0, post - context)
+
+    diff = list(difflib.unified_diff(
+        a_lines[pre:len(a_lines) - post],
+        b_lines[pre:len(b_lines) - post],
+        fromfile=fromfile,
+        tofile=tofile,
+        n=context,
+    ))
+    if pre:
+        for i, line in enumerate(diff):
+            m = _HUNK_RE.match(line)
+            if m:
+                diff[i] = (
+                    f"@@ -{int(m.group(1)) + pre}{m.group(2)} "
+                    f"+{int(m.group(3)) + pre}{m.group(4)} @@{line[m.end():]}"
+                )
+    return diff
+
 
 class VersionManager:
     """챕터 버전을 SQLite에 기록하고 diff/롤백을 지원"""
@@ -155,12 +204,12 @@ class VersionManager:
         if not b:
             return {"error": f"버전 {version_b} 없음"}
 
-        diff = list(difflib.unified_diff(
+        diff = _trimmed_unified_diff(
             a["content"].splitlines(keepends=True),
             b["content"].splitlines(keepends=True),
             fromfile=f"v{version_a}",
             tofile=f"v{version_b}",
-        ))
+        )
         return {
             "project_id": project_id,
             "chapter_num": chapter_num,
@@ -24,6 +24,7 @@ from fastapi.staticfiles import StaticFiles
 from src.agent.core import AgentCore
 from src.messenger.telegram import TelegramBot
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from src.web.dashboard import router as dashboard_router
 from src.web.chat_widget import router as chat_widget_router
 
@@ -117,6 +118,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# JSON/HTML 응답 압축 — 작은 응답은 압축 오버헤드가 더 커서 제외
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 from src.web.preview import router as preview_router
 app.include_router(preview_router)
 app.include_router(chat_widget_router)
@@ -12,15 +12,18 @@ class Tool(ABC):
     parameters: dict[str, Any] = {}  # JSON Schema 형식
 
     def to_openai_tool(self) -> dict:
-        """OpenAI function calling 포맷으로 변환"""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        """OpenAI function calling 포맷으로 변환 (인스턴스당 1회 생성 후 재사용)"""
+        cached = getattr(self, "_openai_tool", None)
+        if cached is None:
+            cached = self._openai_tool = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return cached
 
     @abstractmethod
     async def execute(self, **kwargs) -> str:
@@ -136,8 +136,8 @@ class CalculateBreakevenTool(Tool):
 
 
 ALL_BUSINESS_TOOLS = [
-    CalculateRoyaltyTool,
-    EstimateProductionCostTool,
-    CreatePublishingScheduleTool,
-    CalculateBreakevenTool,
+    CalculateRoyaltyTool(),
+    EstimateProductionCostTool(),
+    CreatePublishingScheduleTool(),
+    CalculateBreakevenTool(),
 ]
@@ -175,12 +175,12 @@ class SaveFeedbackTool(Tool):
 
 # 모든 창작 도구 목록
 ALL_CREATIVE_TOOLS = [
-    CreateProjectTool,
-    ListProjectsTool,
-    LoadProjectTool,
-    SaveOutlineTool,
-    SaveDraftTool,
-    GetOutlineTool,
-    GetDraftTool,
-    SaveFeedbackTool,
+    CreateProjectTool(),
+    ListProjectsTool(),
+    LoadProjectTool(),
+    SaveOutlineTool(),
+    SaveDraftTool(),
+    GetOutlineTool(),
+    GetDraftTool(),
+    SaveFeedbackTool(),
 ]
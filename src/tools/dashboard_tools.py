@@ -60,4 +60,4 @@ class SetWritingGoalTool(Tool):
         return json.dumps({"project_id": project_id, "goal": goal}, ensure_ascii=False)
 
 
-ALL_DASHBOARD_TOOLS = [GetProjectStatsTool, SetWritingGoalTool]
+ALL_DASHBOARD_TOOLS = [GetProjectStatsTool(), SetWritingGoalTool()]
@@ -56,4 +56,4 @@ class CheckEpubMetadataTool(Tool):
             return json.dumps({"error": str(e)}, ensure_ascii=False)
 
 
-ALL_EPUB_TOOLS = [ValidateEpubTool, CheckEpubMetadataTool]
+ALL_EPUB_TOOLS = [ValidateEpubTool(), CheckEpubMetadataTool()]
@@ -161,8 +161,8 @@ class GenerateCoverTool(Tool):
 
 # 모든 내보내기 도구 목록
 ALL_EXPORT_TOOLS = [
-    ExportManuscriptTool,
-    ListPresetsTool,
-    ListExportsTool,
-    GenerateCoverTool,
+    ExportManuscriptTool(),
+    ListPresetsTool(),
+    ListExportsTool(),
+    GenerateCoverTool(),
 ]
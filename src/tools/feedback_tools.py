@@ -1,7 +1,7 @@
 from __future__ import annotations
 """AI 피드백 도구 — function calling 도구"""
 import json
-from typing import List, Type
+from typing import List
 
 from src.tools.base import Tool
 from src.creative import ai_feedback
@@ -77,8 +77,8 @@ class GetPacingAnalysisTool(Tool):
         return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-ALL_FEEDBACK_TOOLS: List[Type[Tool]] = [
-    GetChapterFeedbackTool,
-    GetCharacterFeedbackTool,
-    GetPacingAnalysisTool,
+ALL_FEEDBACK_TOOLS: List[Tool] = [
+    GetChapterFeedbackTool(),
+    GetCharacterFeedbackTool(),
+    GetPacingAnalysisTool(),
 ]
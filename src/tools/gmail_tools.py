@@ -295,4 +295,4 @@ class GmailSummaryTool(Tool):
             return f"❌ Gmail 요약 실패: {e}"
 
 
-ALL_GMAIL_TOOLS = [GmailListTool, GmailReadTool, GmailSearchTool, GmailSummaryTool]
+ALL_GMAIL_TOOLS = [GmailListTool(), GmailReadTool(), GmailSearchTool(), GmailSummaryTool()]
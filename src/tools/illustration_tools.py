@@ -398,8 +398,8 @@ class IllustrationListTool(Tool):
 
 
 ALL_ILLUSTRATION_TOOLS = [
-    IllustrationGenerateTool,
-    IllustrationFromChapterTool,
-    IllustrationCoverTool,
-    IllustrationListTool,
+    IllustrationGenerateTool(),
+    IllustrationFromChapterTool(),
+    IllustrationCoverTool(),
+    IllustrationListTool(),
 ]
@@ -99,8 +99,8 @@ class FormatColophonTool(Tool):
         return text
 
 
-ALL_ISBN_TOOLS: list[type[Tool]] = [
-    GenerateISBNBarcodeTool,
-    ValidateISBNTool,
-    FormatColophonTool,
+ALL_ISBN_TOOLS: list[Tool] = [
+    GenerateISBNBarcodeTool(),
+    ValidateISBNTool(),
+    FormatColophonTool(),
 ]
@@ -1,7 +1,14 @@
 from __future__ import annotations
 """원고 분석 도구 — 통계, 목차, 참고문헌, 색인"""
 
+import io
 import json
+
+try:
+    import orjson  # C 구현 파서 — 문자열로 들어온 참고문헌 파싱 가속
+except ImportError:
+    orjson = None
+
 from src.tools.base import Tool
 from src.creative.manuscript_analyzer import ManuscriptAnalyzer
 
@@ -30,15 +37,16 @@ class AnalyzeManuscriptTool(Tool):
             return "❌ 분석할 텍스트가 비어 있습니다."
         stats = _analyzer.analyze_stats(text)
         result = stats.to_dict()
-        lines = ["📊 **원고 통계**", ""]
+        buf = io.StringIO()
+        buf.write("📊 **원고 통계**\n")
         for key, val in result.items():
             if key == "예상 페이지수":
-                lines.append(f"**{key}:**")
+                buf.write(f"\n**{key}:**")
                 for fmt, pages in val.items():
-                    lines.append(f"  • {fmt}: 약 {pages}쪽")
+                    buf.write(f"\n  • {fmt}: 약 {pages}쪽")
             else:
-                lines.append(f"**{key}:** {val}")
-        return "\n".join(lines)
+                buf.write(f"\n**{key}:** {val}")
+        return buf.getvalue()
 
 
 class GenerateTOCTool(Tool):
@@ -111,13 +119,9 @@ class ManageReferencesTool(Tool):
             if not ref_data:
                 return "❌ 추가할 참고문헌 정보가 필요합니다."
             if isinstance(ref_data, str):
-                ref_data = json.loads(ref_data)
-            _analyzer.load_references([ref_data])
-            ref_id = ref_data.get("id", ref_data.get("ref_id", ""))
-            ref = _analyzer.get_reference(ref_id)
-            if ref:
-                return f"✅ 참고문헌 추가 완료:\n{ref.format(style)}"
-            return "✅ 참고문헌이 추가되었습니다."
+                ref_data = orjson.loads(ref_data) if orjson else json.loads(ref_data)
+            ref = _analyzer.add_reference_dict(ref_data)
+            return f"✅ 참고문헌 추가 완료:\n{ref.format(style)}"
 
         elif action == "get":
             ref_id = kwargs.get("ref_id", "")
@@ -132,10 +136,11 @@ class ManageReferencesTool(Tool):
             refs = _analyzer.list_references(style)
             if not refs:
                 return "📚 등록된 참고문헌이 없습니다."
-            lines = [f"📚 **참고문헌 목록 ({style.upper()} 스타일)**", ""]
+            buf = io.StringIO()
+            buf.write(f"📚 **참고문헌 목록 ({style.upper()} 스타일)**\n")
             for i, ref_str in enumerate(refs, 1):
-                lines.append(f"{i}. {ref_str}")
-            return "\n".join(lines)
+                buf.write(f"\n{i}. {ref_str}")
+            return buf.getvalue()
 
         return f"❌ 알 수 없는 작업: {action}"
 
@@ -173,8 +178,8 @@ class GenerateIndexTool(Tool):
 
 
 ALL_MANUSCRIPT_TOOLS = [
-    AnalyzeManuscriptTool,
-    GenerateTOCTool,
-    ManageReferencesTool,
-    GenerateIndexTool,
+    AnalyzeManuscriptTool(),
+    GenerateTOCTool(),
+    ManageReferencesTool(),
+    GenerateIndexTool(),
 ]
@@ -1,9 +1,15 @@
 from __future__ import annotations
 """시장 분석 도구 — function calling 도구"""
 import json
+import time
 from src.tools.base import Tool
 from src.creative.market_analysis import MarketAnalyzer
 
+# 검색 결과 TTL 캐시 — 같은 세션에서 반복되는 동일 쿼리의 HTTP+분석 재실행 방지
+_REPORT_CACHE: dict[tuple[str, int], tuple[float, str]] = {}
+_REPORT_TTL = 600  # 초
+_REPORT_CACHE_MAX = 256
+
 
 class SearchSimilarBooksTool(Tool):
     name = "search_similar_books"
@@ -20,11 +26,19 @@ class SearchSimilarBooksTool(Tool):
     async def execute(self, **kwargs) -> str:
         query = kwargs["query"]
         max_results = kwargs.get("max_results", 10)
+        cache_key = (query, max_results)
+        cached = _REPORT_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _REPORT_TTL:
+            return cached[1]
         try:
             report = await MarketAnalyzer.full_analysis(query)
-            return report.to_markdown()
+            markdown = report.to_markdown()
         except Exception as e:
             return json.dumps({"error": str(e)}, ensure_ascii=False)
+        if len(_REPORT_CACHE) >= _REPORT_CACHE_MAX:
+            _REPORT_CACHE.pop(next(iter(_REPORT_CACHE)))
+        _REPORT_CACHE[cache_key] = (time.monotonic(), markdown)
+        return markdown
 
 
 class RecommendCategoryTool(Tool):
@@ -54,4 +68,4 @@ class RecommendCategoryTool(Tool):
             return json.dumps({"error": str(e)}, ensure_ascii=False)
 
 
-ALL_MARKET_TOOLS = [SearchSimilarBooksTool, RecommendCategoryTool]
+ALL_MARKET_TOOLS = [SearchSimilarBooksTool(), RecommendCategoryTool()]
@@ -147,9 +147,9 @@ class AnalyzeTargetReadersTool(Tool):
         )
 
 
-ALL_MARKETING_TOOLS: List[type] = [
-    GenerateBookDescriptionTool,
-    GenerateObiTextTool,
-    GenerateSnsPromoTool,
-    AnalyzeTargetReadersTool,
+ALL_MARKETING_TOOLS: List[Tool] = [
+    GenerateBookDescriptionTool(),
+    GenerateObiTextTool(),
+    GenerateSnsPromoTool(),
+    AnalyzeTargetReadersTool(),
 ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 """메모리 도구 — 사용자 정보 저장/조회, 메모 저장/검색"""
+import io
+
 from src.tools.base import Tool
 from src.agent.long_term_memory import LongTermMemory
 
@@ -57,8 +59,11 @@ class RecallFactsTool(Tool):
         facts = await _ltm_instance.get_facts(kwargs["user_id"])
         if not facts:
             return "저장된 사용자 정보가 없습니다."
-        lines = [f"- {f['key']}: {f['value']}" for f in facts]
-        return "📋 사용자 정보:\n" + "\n".join(lines)
+        buf = io.StringIO()
+        buf.write("📋 사용자 정보:")
+        for f in facts:
+            buf.write(f"\n- {f['key']}: {f['value']}")
+        return buf.getvalue()
 
 
 class SaveNoteTool(Tool):
@@ -115,12 +120,13 @@ class SearchNotesTool(Tool):
         notes = await _ltm_instance.search_notes(user_id, query=query, tag=tag)
         if not notes:
             return "검색 결과가 없습니다."
-        lines = []
+        buf = io.StringIO()
+        buf.write("🔍 검색 결과:")
         for n in notes:
             tag_str = f" [{', '.join(n['tags'])}]" if n["tags"] else ""
-            lines.append(f"- {n['content']}{tag_str}")
-        return "🔍 검색 결과:\n" + "\n".join(lines)
+            buf.write(f"\n- {n['content']}{tag_str}")
+        return buf.getvalue()
 
 
 # 레지스트리 등록용
-ALL_MEMORY_TOOLS = [RememberFactTool, RecallFactsTool, SaveNoteTool, SearchNotesTool]
+ALL_MEMORY_TOOLS = [RememberFactTool(), RecallFactsTool(), SaveNoteTool(), SearchNotesTool()]
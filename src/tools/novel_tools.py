@@ -1,6 +1,7 @@
 from __future__ import annotations
 """소설 도구 — 소설 프로젝트 관리용 function calling 도구"""
 import json
+from functools import lru_cache
 
 from src.tools.base import Tool
 from src.creative.novel_engine import NovelEngine
@@ -16,6 +17,18 @@ def _project_dir(project_id: str):
     return _engine.pm.base_dir / project_id
 
 
+@lru_cache(maxsize=32)
+def _get_cm(project_id: str) -> CharacterManager:
+    """프로젝트별 CharacterManager 캐시 (호출마다 디렉토리 생성/확인 생략)"""
+    return CharacterManager(_project_dir(project_id))
+
+
+@lru_cache(maxsize=32)
+def _get_wb(project_id: str) -> WorldBuilder:
+    """프로젝트별 WorldBuilder 캐시"""
+    return WorldBuilder(_project_dir(project_id))
+
+
 # ── 프로젝트 ────────────────────────────────────────
 
 
@@ -211,7 +224,7 @@ class CreateCharacterTool(Tool):
 
     async def execute(self, **kwargs) -> str:
         pid = kwargs.pop("project_id")
-        cm = CharacterManager(_project_dir(pid))
+        cm = _get_cm(pid)
         try:
             sheet = cm.create(kwargs)
             return json.dumps(sheet, ensure_ascii=False)
@@ -232,7 +245,7 @@ class GetCharacterTool(Tool):
     }
 
     async def execute(self, **kwargs) -> str:
-        cm = CharacterManager(_project_dir(kwargs["project_id"]))
+        cm = _get_cm(kwargs["project_id"])
         try:
             sheet = cm.get(kwargs["name"])
             return json.dumps(sheet, ensure_ascii=False)
@@ -252,7 +265,7 @@ class ListCharactersTool(Tool):
     }
 
     async def execute(self, **kwargs) -> str:
-        cm = CharacterManager(_project_dir(kwargs["project_id"]))
+        cm = _get_cm(kwargs["project_id"])
         chars = cm.list_all()
         if not chars:
             return "캐릭터가 없습니다."
@@ -276,7 +289,7 @@ class UpdateCharacterTool(Tool):
     }
 
     async def execute(self, **kwargs) -> str:
-        cm = CharacterManager(_project_dir(kwargs["project_id"]))
+        cm = _get_cm(kwargs["project_id"])
         try:
             sheet = cm.update(kwargs["name"], kwargs["updates"])
             return json.dumps(sheet, ensure_ascii=False)
@@ -305,7 +318,7 @@ class SaveWorldbuildingTool(Tool):
     }
 
     async def execute(self, **kwargs) -> str:
-        wb = WorldBuilder(_project_dir(kwargs["project_id"]))
+        wb = _get_wb(kwargs["project_id"])
         wb.save(kwargs["doc_type"], kwargs["content"])
         return f"세계관 {kwargs['doc_type']}이(가) 저장되었습니다."
 
@@ -327,7 +340,7 @@ class GetWorldbuildingTool(Tool):
     }
 
     async def execute(self, **kwargs) -> str:
-        wb = WorldBuilder(_project_dir(kwargs["project_id"]))
+        wb = _get_wb(kwargs["project_id"])
         content = wb.get(kwargs["doc_type"])
         return content or f"{kwargs['doc_type']} 문서가 아직 없습니다."
 
@@ -355,20 +368,20 @@ class SaveNotesTool(Tool):
 # ── 모든 소설 도구 목록 ─────────────────────────────
 
 ALL_NOVEL_TOOLS = [
-    CreateNovelProjectTool,
-    GetProjectStatusTool,
-    SaveSynopsisTool,
-    GetSynopsisTool,
-    SaveChapterOutlineTool,
-    GetChapterOutlineTool,
-    SaveChapterTool,
-    GetChapterTool,
-    ListChaptersTool,
-    CreateCharacterTool,
-    GetCharacterTool,
-    ListCharactersTool,
-    UpdateCharacterTool,
-    SaveWorldbuildingTool,
-    GetWorldbuildingTool,
-    SaveNotesTool,
+    CreateNovelProjectTool(),
+    GetProjectStatusTool(),
+    SaveSynopsisTool(),
+    GetSynopsisTool(),
+    SaveChapterOutlineTool(),
+    GetChapterOutlineTool(),
+    SaveChapterTool(),
+    GetChapterTool(),
+    ListChaptersTool(),
+    CreateCharacterTool(),
+    GetCharacterTool(),
+    ListCharactersTool(),
+    UpdateCharacterTool(),
+    SaveWorldbuildingTool(),
+    GetWorldbuildingTool(),
+    SaveNotesTool(),
 ]
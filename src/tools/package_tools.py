@@ -1,6 +1,8 @@
 from __future__ import annotations
 """출판사 제출 패키징 도구"""
 
+import functools
+
 from src.tools.base import Tool
 from src.creative.packager import (
     create_package,
@@ -9,6 +11,10 @@ from src.creative.packager import (
     run_checklist,
 )
 
+# 순수 템플릿 포맷터만 캐시 — generate_synopsis_text는 작성일(오늘 날짜)을
+# 본문에 넣으므로 캐시하면 날이 바뀌어도 옛 날짜가 박힌다
+_gen_author_bio = functools.lru_cache(maxsize=128)(generate_author_bio)
+
 
 class CreateSubmissionPackageTool(Tool):
     name = "create_submission_package"
@@ -29,8 +35,13 @@ class CreateSubmissionPackageTool(Tool):
     async def execute(self, **kwargs) -> str:
         title = kwargs["title"]
         manuscript_path = kwargs["manuscript_path"]
-        synopsis = kwargs.get("synopsis") or generate_synopsis_text(title, "(원고 내용 요약을 입력해주세요)")
-        author_bio = kwargs.get("author_bio") or generate_author_bio()
+        # 호출자가 값을 준 일반 경우에는 기본 템플릿 생성을 건너뛴다
+        synopsis = kwargs.get("synopsis")
+        if not synopsis:
+            synopsis = generate_synopsis_text(title, "(원고 내용 요약을 입력해주세요)")
+        author_bio = kwargs.get("author_bio")
+        if not author_bio:
+            author_bio = _gen_author_bio()
         cover_image_path = kwargs.get("cover_image_path")
         output_dir = kwargs.get("output_dir")
 
@@ -116,7 +127,7 @@ class SubmissionChecklistTool(Tool):
 
 
 ALL_PACKAGE_TOOLS = [
-    CreateSubmissionPackageTool,
-    GenerateSynopsisTool,
-    SubmissionChecklistTool,
+    CreateSubmissionPackageTool(),
+    GenerateSynopsisTool(),
+    SubmissionChecklistTool(),
 ]
@@ -46,4 +46,4 @@ class StartPreviewTool(Tool):
         )
 
 
-ALL_PREVIEW_TOOLS = [StartPreviewTool]
+ALL_PREVIEW_TOOLS = [StartPreviewTool()]
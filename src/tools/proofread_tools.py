@@ -1,15 +1,67 @@
 from __future__ import annotations
 """교정/퇴고 도구 — function calling 도구"""
+import asyncio
 import json
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from src.tools.base import Tool
 from src.creative.proofreader import Proofreader
 from src.creative.novel_engine import NovelEngine
 
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """도구 응답용 JSON 직렬화 — orjson 우선 (ensure_ascii 분기 없음)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
 _engine = NovelEngine()
 
 
+@lru_cache(maxsize=512)
+def _read_file_cached(path: str, mtime_ns: int) -> str:
+    """파일 내용 캐시 — (경로, mtime) 키라 수정되면 자동으로 새로 읽음"""
+    return Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=64)
+def _list_md_files(dir_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """디렉토리의 정렬된 .md 목록 캐시 — 파일 추가/삭제 시 mtime 변경으로 무효화"""
+    return tuple(sorted(str(p) for p in Path(dir_path).glob("*.md")))
+
+
+def _read_cached(p: Path) -> str:
+    return _read_file_cached(str(p), p.stat().st_mtime_ns)
+
+
+_CHAPTER_NUM_RE = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=64)
+def _chapter_map(dir_path: str, mtime_ns: int) -> dict[int, str]:
+    """챕터 번호 → 파일 경로 매핑 — scandir 한 번으로 구성 (후보별 stat 제거)"""
+    mapping: dict[int, str] = {}
+    with os.scandir(dir_path) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if not entry.name.endswith(".md"):
+                continue
+            m = _CHAPTER_NUM_RE.search(entry.name)
+            if m:
+                # 같은 번호가 여러 파일에 매칭되면 이름순 첫 파일 우선
+                mapping.setdefault(int(m.group(1)), entry.path)
+    return mapping
+
+
 def _read_chapter(project_id: str, chapter_num: int) -> str:
     """챕터 파일 읽기"""
     project_dir = _engine.pm.base_dir / project_id
@@ -17,18 +69,14 @@ def _read_chapter(project_id: str, chapter_num: int) -> str:
     chapters_dir = project_dir / "chapters"
     if not chapters_dir.exists():
         return ""
-    candidates = [
-        chapters_dir / f"{chapter_num:02d}.md",
-        chapters_dir / f"chapter_{chapter_num:02d}.md",
-        chapters_dir / f"{chapter_num}.md",
-    ]
-    for p in candidates:
-        if p.exists():
-            return p.read_text(encoding="utf-8")
-    # 번호로 정렬된 파일 목록에서 n번째
-    md_files = sorted(chapters_dir.glob("*.md"))
+    mtime_ns = chapters_dir.stat().st_mtime_ns
+    path = _chapter_map(str(chapters_dir), mtime_ns).get(chapter_num)
+    if path:
+        return _read_cached(Path(path))
+    # 번호 없는 파일명 등은 정렬된 목록의 n번째로 폴백
+    md_files = _list_md_files(str(chapters_dir), mtime_ns)
     if 0 < chapter_num <= len(md_files):
-        return md_files[chapter_num - 1].read_text(encoding="utf-8")
+        return _read_cached(Path(md_files[chapter_num - 1]))
     return ""
 
 
@@ -39,11 +87,42 @@ def _read_all_chapters(project_id: str) -> dict:
     if not chapters_dir.exists():
         return {}
     result = {}
-    for f in sorted(chapters_dir.glob("*.md")):
-        result[f.stem] = f.read_text(encoding="utf-8")
+    for name in _list_md_files(str(chapters_dir), chapters_dir.stat().st_mtime_ns):
+        f = Path(name)
+        result[f.stem] = _read_cached(f)
     return result
 
 
+async def _read_all_chapters_async(project_id: str) -> dict:
+    """모든 챕터를 동시 스레드 읽기로 적재 (캐시 미스 시 디스크 I/O 중첩)"""
+    project_dir = _engine.pm.base_dir / project_id
+    chapters_dir = project_dir / "chapters"
+    if not chapters_dir.exists():
+        return {}
+    paths = [
+        Path(name)
+        for name in _list_md_files(str(chapters_dir), chapters_dir.stat().st_mtime_ns)
+    ]
+    texts = await asyncio.gather(*(asyncio.to_thread(_read_cached, p) for p in paths))
+    return {p.stem: t for p, t in zip(paths, texts)}
+
+
+def _read_all_chapters_text(project_id: str) -> str:
+    """전체 챕터를 하나의 텍스트로 연결 — 중간 dict 없이 바로 합친다"""
+    project_dir = _engine.pm.base_dir / project_id
+    chapters_dir = project_dir / "chapters"
+    if not chapters_dir.exists():
+        return ""
+    # str.join은 전체 길이를 먼저 합산해 결과 버퍼를 한 번에 할당한다
+    # (제너레이터 대신 리스트를 넘겨 내부 list 변환 단계도 생략)
+    return "\n\n".join(
+        [
+            _read_cached(Path(name))
+            for name in _list_md_files(str(chapters_dir), chapters_dir.stat().st_mtime_ns)
+        ]
+    )
+
+
 class ProofreadChapterTool(Tool):
     name = "proofread_chapter"
     description = "특정 챕터의 맞춤법, 문체, 중복 표현을 교정 검사합니다"
@@ -63,10 +142,10 @@ class ProofreadChapterTool(Tool):
             project_id = kwargs.get("project_id", "")
             chapter_num = kwargs.get("chapter_number", 1)
             if not project_id:
-                return json.dumps({"error": "project_id 또는 text를 제공해주세요"}, ensure_ascii=False)
+                return _dumps({"error": "project_id 또는 text를 제공해주세요"})
             text = _read_chapter(project_id, chapter_num)
             if not text:
-                return json.dumps({"error": f"챕터 {chapter_num}을(를) 찾을 수 없습니다"}, ensure_ascii=False)
+                return _dumps({"error": f"챕터 {chapter_num}을(를) 찾을 수 없습니다"})
 
         report = Proofreader.analyze(text)
         return report.to_markdown()
@@ -85,10 +164,11 @@ class CheckStyleConsistencyTool(Tool):
 
     async def execute(self, **kwargs) -> str:
         project_id = kwargs["project_id"]
-        chapters = _read_all_chapters(project_id)
+        chapters = await _read_all_chapters_async(project_id)
         if not chapters:
-            return json.dumps({"error": "챕터를 찾을 수 없습니다"}, ensure_ascii=False)
-        return Proofreader.compare_styles(chapters)
+            return _dumps({"error": "챕터를 찾을 수 없습니다"})
+        # CPU 바운드 문체 분석은 스레드로 넘겨 이벤트 루프 블로킹 방지
+        return await asyncio.to_thread(Proofreader.compare_styles, chapters)
 
 
 class FindDuplicatesTool(Tool):
@@ -112,16 +192,15 @@ class FindDuplicatesTool(Tool):
         if not text:
             project_id = kwargs.get("project_id", "")
             if not project_id:
-                return json.dumps({"error": "project_id 또는 text를 제공해주세요"}, ensure_ascii=False)
+                return _dumps({"error": "project_id 또는 text를 제공해주세요"})
             chapter_num = kwargs.get("chapter_number")
             if chapter_num:
                 text = _read_chapter(project_id, chapter_num)
             else:
-                chapters = _read_all_chapters(project_id)
-                text = "\n\n".join(chapters.values())
+                text = _read_all_chapters_text(project_id)
 
         if not text:
-            return json.dumps({"error": "분석할 텍스트가 없습니다"}, ensure_ascii=False)
+            return _dumps({"error": "분석할 텍스트가 없습니다"})
 
         dupes = Proofreader.find_duplicates(text, min_count=min_count)
         if not dupes:
@@ -134,7 +213,7 @@ class FindDuplicatesTool(Tool):
 
 
 ALL_PROOFREAD_TOOLS = [
-    ProofreadChapterTool,
-    CheckStyleConsistencyTool,
-    FindDuplicatesTool,
+    ProofreadChapterTool(),
+    CheckStyleConsistencyTool(),
+    FindDuplicatesTool(),
 ]
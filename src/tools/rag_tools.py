@@ -2,10 +2,24 @@ from __future__ import annotations
 """RAG 도구 — 참조 자료 인덱싱 및 검색"""
 
 import json
+
 from src.tools.base import Tool
 from src.agent import rag
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """도구 응답용 JSON 직렬화 — orjson 우선 (ensure_ascii 분기 없음)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
 class IndexDocumentTool(Tool):
     name = "index_document"
     description = "텍스트 파일(MD/TXT)을 RAG 인덱스에 추가합니다. 창작 참조 자료로 활용됩니다."
@@ -53,7 +67,7 @@ class SearchReferencesTool(Tool):
         results = rag.search(query, top_k=top_k)
         if not results:
             return "검색 결과가 없습니다."
-        return json.dumps(results, ensure_ascii=False, indent=2)
+        return _dumps(results)
 
 
 class ListIndexedDocumentsTool(Tool):
@@ -68,7 +82,7 @@ class ListIndexedDocumentsTool(Tool):
         docs = rag.list_documents()
         if not docs:
             return "인덱싱된 문서가 없습니다."
-        return json.dumps(docs, ensure_ascii=False, indent=2)
+        return _dumps(docs)
 
 
 class RemoveDocumentTool(Tool):
@@ -93,8 +107,8 @@ class RemoveDocumentTool(Tool):
 
 
 ALL_RAG_TOOLS = [
-    IndexDocumentTool,
-    SearchReferencesTool,
-    ListIndexedDocumentsTool,
-    RemoveDocumentTool,
+    IndexDocumentTool(),
+    SearchReferencesTool(),
+    ListIndexedDocumentsTool(),
+    RemoveDocumentTool(),
 ]
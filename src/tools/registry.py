@@ -1,5 +1,7 @@
 from __future__ import annotations
 """도구 레지스트리 — 도구 등록/조회 및 OpenAI 포맷 변환"""
+import importlib
+
 from src.tools.base import Tool
 
 
@@ -8,141 +10,90 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._openai_cache: list[dict] | None = None
 
     def register(self, tool: Tool):
         """도구 등록"""
         self._tools[tool.name] = tool
+        self._openai_cache = None
 
     def get(self, name: str) -> Tool | None:
         """이름으로 도구 조회"""
         return self._tools.get(name)
 
     def to_openai_tools(self) -> list[dict]:
-        """등록된 모든 도구를 OpenAI tools 포맷으로 반환"""
-        return [t.to_openai_tool() for t in self._tools.values()]
+        """등록된 모든 도구를 OpenAI tools 포맷으로 반환 (등록 변경 전까지 캐시)"""
+        if self._openai_cache is None:
+            self._openai_cache = [t.to_openai_tool() for t in self._tools.values()]
+        return self._openai_cache
 
     @property
     def tools(self) -> dict[str, Tool]:
         return self._tools
 
 
-def create_default_registry() -> ToolRegistry:
-    """기본 도구들이 등록된 레지스트리 생성"""
-    from src.tools.datetime_tool import DateTimeTool
-    from src.tools.weather import WeatherTool
-    from src.tools.calendar import CalendarTool
-    from src.tools.search import SearchTool
-
-    from src.tools.creative_tools import ALL_CREATIVE_TOOLS
-    from src.tools.novel_tools import ALL_NOVEL_TOOLS
-    from src.tools.memory_tools import ALL_MEMORY_TOOLS
-    from src.tools.export_tools import ALL_EXPORT_TOOLS
-    from src.tools.preview_tools import ALL_PREVIEW_TOOLS
-    from src.tools.feedback_tools import ALL_FEEDBACK_TOOLS
-    from src.tools.rag_tools import ALL_RAG_TOOLS
-    from src.tools.version_tools import ALL_VERSION_TOOLS
-    from src.tools.package_tools import ALL_PACKAGE_TOOLS
-    from src.tools.isbn_tools import ALL_ISBN_TOOLS
-    from src.tools.proofread_tools import ALL_PROOFREAD_TOOLS
-    from src.tools.dashboard_tools import ALL_DASHBOARD_TOOLS
-    from src.tools.market_tools import ALL_MARKET_TOOLS
-    from src.tools.translation_tools import ALL_TRANSLATION_TOOLS
-    from src.tools.epub_tools import ALL_EPUB_TOOLS
-    from src.tools.manuscript_tools import ALL_MANUSCRIPT_TOOLS
-    from src.tools.business_tools import ALL_BUSINESS_TOOLS
-    from src.tools.marketing_tools import ALL_MARKETING_TOOLS
-    from src.tools.gmail_tools import ALL_GMAIL_TOOLS
-    from src.tools.tts_tools import ALL_TTS_TOOLS
-    from src.tools.illustration_tools import ALL_ILLUSTRATION_TOOLS
+# 그룹명 → "모듈:속성" — 그룹이 실제로 필요할 때만 import
+# (gTTS, duckduckgo_search 등 무거운 의존성이 콜드 스타트에 끼어들지 않도록)
+_TOOL_GROUPS: dict[str, str] = {
+    "datetime": "src.tools.datetime_tool:DateTimeTool",
+    "weather": "src.tools.weather:WeatherTool",
+    "calendar": "src.tools.calendar:CalendarTool",
+    "search": "src.tools.search:SearchTool",
+    "creative": "src.tools.creative_tools:ALL_CREATIVE_TOOLS",        # 창작 도구
+    "novel": "src.tools.novel_tools:ALL_NOVEL_TOOLS",                 # 소설 도구
+    "memory": "src.tools.memory_tools:ALL_MEMORY_TOOLS",              # 메모리 도구
+    "export": "src.tools.export_tools:ALL_EXPORT_TOOLS",              # 내보내기 도구
+    "rag": "src.tools.rag_tools:ALL_RAG_TOOLS",                       # RAG 도구
+    "isbn": "src.tools.isbn_tools:ALL_ISBN_TOOLS",                    # ISBN/바코드 도구
+    "version": "src.tools.version_tools:ALL_VERSION_TOOLS",           # 버전 관리 도구
+    "package": "src.tools.package_tools:ALL_PACKAGE_TOOLS",           # 패키징 도구
+    "feedback": "src.tools.feedback_tools:ALL_FEEDBACK_TOOLS",        # AI 피드백 도구
+    "proofread": "src.tools.proofread_tools:ALL_PROOFREAD_TOOLS",     # 교정/퇴고 도구
+    "preview": "src.tools.preview_tools:ALL_PREVIEW_TOOLS",           # 미리보기 도구
+    "dashboard": "src.tools.dashboard_tools:ALL_DASHBOARD_TOOLS",     # 대시보드 도구
+    "marketing": "src.tools.marketing_tools:ALL_MARKETING_TOOLS",     # 마케팅 도구
+    "business": "src.tools.business_tools:ALL_BUSINESS_TOOLS",        # 출판 비즈니스 도구
+    "manuscript": "src.tools.manuscript_tools:ALL_MANUSCRIPT_TOOLS",  # 원고 분석 도구
+    "market": "src.tools.market_tools:ALL_MARKET_TOOLS",              # 시장 분석 도구
+    "translation": "src.tools.translation_tools:ALL_TRANSLATION_TOOLS",  # 번역 도구
+    "epub": "src.tools.epub_tools:ALL_EPUB_TOOLS",                    # EPUB 검증 도구
+    "gmail": "src.tools.gmail_tools:ALL_GMAIL_TOOLS",                 # Gmail 도구
+    "tts": "src.tools.tts_tools:ALL_TTS_TOOLS",                       # TTS 낭독 도구
+    "illustration": "src.tools.illustration_tools:ALL_ILLUSTRATION_TOOLS",  # AI 삽화 생성 도구
+}
+
+
+# 단일 클래스 스펙의 인스턴스 캐시 — 목록 그룹의 모듈 싱글턴과 같은 공유 규칙
+_single_instances: dict[str, Tool] = {}
+
+
+def _load_group(spec: str) -> list[Tool]:
+    """그룹 스펙("모듈:속성")을 지연 import하여 도구 인스턴스 목록으로 반환"""
+    modname, attr = spec.split(":")
+    obj = getattr(importlib.import_module(modname), attr)
+    if isinstance(obj, list):
+        return obj
+    instance = _single_instances.get(spec)
+    if instance is None:
+        instance = _single_instances[spec] = obj()
+    return [instance]
+
+
+def create_default_registry(enabled: list[str] | None = None) -> ToolRegistry:
+    """기본 도구들이 등록된 레지스트리 생성
+
+    enabled에 그룹 이름 목록을 주면 해당 그룹만 import/등록한다.
+    기본(None)은 전체 그룹.
+    """
+    if enabled is None:
+        specs = _TOOL_GROUPS.values()
+    else:
+        specs = [_TOOL_GROUPS[g] for g in enabled]
 
     registry = ToolRegistry()
-    registry.register(DateTimeTool())
-    registry.register(WeatherTool())
-    registry.register(CalendarTool())
-    registry.register(SearchTool())
-
-    # 창작 도구 등록
-    for tool_cls in ALL_CREATIVE_TOOLS:
-        registry.register(tool_cls())
-
-    # 소설 도구 등록
-    for tool_cls in ALL_NOVEL_TOOLS:
-        registry.register(tool_cls())
-
-    # 메모리 도구 등록
-    for tool_cls in ALL_MEMORY_TOOLS:
-        registry.register(tool_cls())
-
-    # 내보내기 도구 등록
-    for tool_cls in ALL_EXPORT_TOOLS:
-        registry.register(tool_cls())
-
-    # RAG 도구 등록
-    for tool_cls in ALL_RAG_TOOLS:
-        registry.register(tool_cls())
-
-    # ISBN/바코드 도구 등록
-    for tool_cls in ALL_ISBN_TOOLS:
-        registry.register(tool_cls())
-
-    # 버전 관리 도구 등록
-    for tool_cls in ALL_VERSION_TOOLS:
-        registry.register(tool_cls())
-
-    # 패키징 도구 등록
-    for tool_cls in ALL_PACKAGE_TOOLS:
-        registry.register(tool_cls())
-
-    # AI 피드백 도구 등록
-    for tool_cls in ALL_FEEDBACK_TOOLS:
-        registry.register(tool_cls())
-
-    # 교정/퇴고 도구 등록
-    for tool_cls in ALL_PROOFREAD_TOOLS:
-        registry.register(tool_cls())
-
-    # 미리보기 도구 등록
-    for tool_cls in ALL_PREVIEW_TOOLS:
-        registry.register(tool_cls())
-
-    # 대시보드 도구 등록
-    for tool_cls in ALL_DASHBOARD_TOOLS:
-        registry.register(tool_cls())
-
-    # 마케팅 도구 등록
-    for tool_cls in ALL_MARKETING_TOOLS:
-        registry.register(tool_cls())
-
-    # 출판 비즈니스 도구 등록
-    for tool_cls in ALL_BUSINESS_TOOLS:
-        registry.register(tool_cls())
-
-    # 원고 분석 도구 등록
-    for tool_cls in ALL_MANUSCRIPT_TOOLS:
-        registry.register(tool_cls())
-
-    # 시장 분석 도구 등록
-    for tool_cls in ALL_MARKET_TOOLS:
-        registry.register(tool_cls())
-
-    # 번역 도구 등록
-    for tool_cls in ALL_TRANSLATION_TOOLS:
-        registry.register(tool_cls())
-
-    # EPUB 검증 도구 등록
-    for tool_cls in ALL_EPUB_TOOLS:
-        registry.register(tool_cls())
-
-    # Gmail 도구 등록
-    for tool_cls in ALL_GMAIL_TOOLS:
-        registry.register(tool_cls())
-
-    # TTS 낭독 도구 등록
-    for tool_cls in ALL_TTS_TOOLS:
-        registry.register(tool_cls())
-
-    # AI 삽화 생성 도구 등록
-    for tool_cls in ALL_ILLUSTRATION_TOOLS:
-        registry.register(tool_cls())
-
+    # register() 반복 호출 대신 단일 dict 구성으로 일괄 등록
+    # (그룹 목록은 모듈 import 시 만들어진 싱글턴 인스턴스를 그대로 공유)
+    registry._tools = {
+        tool.name: tool for spec in specs for tool in _load_group(spec)
+    }
     return registry
@@ -1,8 +1,13 @@
 from __future__ import annotations
 """웹 검색 도구 — DuckDuckGo"""
+import asyncio
+
 from duckduckgo_search import DDGS
 from src.tools.base import Tool
 
+# 모듈 수준 클라이언트 재사용 — 호출마다 새 세션/TLS 핸드셰이크 방지
+_ddgs = DDGS()
+
 
 class SearchTool(Tool):
     name = "web_search"
@@ -20,7 +25,8 @@ class SearchTool(Tool):
         query = kwargs.get("query", "")
         max_results = kwargs.get("max_results", 5)
 
-        results = DDGS().text(query, max_results=max_results)
+        # 동기 클라이언트 호출을 스레드로 넘겨 이벤트 루프 블로킹 방지
+        results = await asyncio.to_thread(_ddgs.text, query, max_results=max_results)
 
         if not results:
             return f"'{query}'에 대한 검색 결과가 없습니다."
@@ -1,11 +1,32 @@
 from __future__ import annotations
 """번역 도구 — function calling 도구"""
 import json
+
 from src.tools.base import Tool
 from src.creative.translator import Translator, GlossaryEntry, SUPPORTED_LANGUAGES
 
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """도구 응답용 JSON 직렬화 — orjson 우선 (ensure_ascii 분기 없음)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
 _translator = Translator()
 
+# 언어쌍별 번역 헤더를 미리 포맷 (호출마다 dict 조회 2회 + f-string 구성 제거)
+_DIRECTION_HEADERS = {
+    (src, tgt): f"## 🌐 번역 ({SUPPORTED_LANGUAGES[src]} → {SUPPORTED_LANGUAGES[tgt]})\n"
+    for src in SUPPORTED_LANGUAGES
+    for tgt in SUPPORTED_LANGUAGES
+}
+
 
 class TranslateTextTool(Tool):
     name = "translate_text"
@@ -31,9 +52,12 @@ class TranslateTextTool(Tool):
 
         result = await _translator.translate(text, source_lang, target_lang, project_id, style)
         if result.error:
-            return json.dumps({"error": result.error}, ensure_ascii=False)
+            return _dumps({"error": result.error})
 
-        lines = [f"## 🌐 번역 ({SUPPORTED_LANGUAGES.get(source_lang, source_lang)} → {SUPPORTED_LANGUAGES.get(target_lang, target_lang)})\n"]
+        header = _DIRECTION_HEADERS.get((source_lang, target_lang))
+        if header is None:  # 미등록 언어 코드는 코드 그대로 표기
+            header = f"## 🌐 번역 ({SUPPORTED_LANGUAGES.get(source_lang, source_lang)} → {SUPPORTED_LANGUAGES.get(target_lang, target_lang)})\n"
+        lines = [header]
         lines.append(result.translated)
         if result.glossary_applied:
             lines.append(f"\n📖 적용된 용어집: {', '.join(result.glossary_applied)}")
@@ -67,7 +91,7 @@ class ManageGlossaryTool(Tool):
             source_term = kwargs.get("source_term", "")
             target_term = kwargs.get("target_term", "")
             if not source_term or not target_term:
-                return json.dumps({"error": "source_term과 target_term이 필요합니다"}, ensure_ascii=False)
+                return _dumps({"error": "source_term과 target_term이 필요합니다"})
             entry = GlossaryEntry(
                 source_term=source_term, target_term=target_term,
                 source_lang=source_lang, target_lang=target_lang,
@@ -79,7 +103,7 @@ class ManageGlossaryTool(Tool):
         elif action == "remove":
             source_term = kwargs.get("source_term", "")
             if not source_term:
-                return json.dumps({"error": "source_term이 필요합니다"}, ensure_ascii=False)
+                return _dumps({"error": "source_term이 필요합니다"})
             ok = _translator.glossary.remove(source_term, source_lang, target_lang, project_id)
             return f"✅ 용어 삭제: {source_term}" if ok else "❌ 해당 용어를 찾을 수 없습니다"
 
@@ -94,7 +118,7 @@ class ManageGlossaryTool(Tool):
                     lines.append(f"  _{e.context}_")
             return "\n".join(lines)
 
-        return json.dumps({"error": f"알 수 없는 action: {action}"}, ensure_ascii=False)
+        return _dumps({"error": f"알 수 없는 action: {action}"})
 
 
-ALL_TRANSLATION_TOOLS = [TranslateTextTool, ManageGlossaryTool]
+ALL_TRANSLATION_TOOLS = [TranslateTextTool(), ManageGlossaryTool()]
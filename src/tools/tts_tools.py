@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import re
 import hashlib
+import shutil
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -21,24 +22,54 @@ def _ensure_tts_dir():
     TTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# 모듈 로드 시 1회 컴파일 — 호출마다 re 캐시 조회 생략
+# (행머리 마커는 정규식 없이 str 연산으로 처리 — _strip_line_prefix 참고)
+_RE_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_RE_ITALIC = re.compile(r"\*(.+?)\*")
+_RE_INLINE_CODE = re.compile(r"`(.+?)`")
+_RE_CODE_BLOCK = re.compile(r"```[\s\S]*?```")
+_RE_IMAGE = re.compile(r"!\[.*?\]\(.*?\)")
+_RE_LINK = re.compile(r"\[(.+?)\]\(.*?\)")
+_RE_HR = re.compile(r"---+")
+
+
+_MD_MARKERS = frozenset("#-*+>")
+
+
+def _strip_line_prefix(line: str) -> str:
+    """행머리 마커(헤더/리스트/인용)를 제거 — 정규식 엔진 없이 C 수준 str 연산"""
+    c = line[:1]
+    if c not in _MD_MARKERS:
+        return line
+    if c == "#":
+        n = len(line) - len(line.lstrip("#"))
+        if n > 6:
+            return line
+    else:
+        n = 1
+    rest = line[n:]
+    stripped = rest.lstrip(" \t")
+    # 마커 뒤에 공백이 올 때만 마커로 취급
+    return stripped if len(stripped) != len(rest) else line
+
+
 def _strip_markdown(text: str) -> str:
     """마크다운 태그를 제거하고 순수 텍스트만 반환"""
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)  # 헤더
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)  # 볼드
-    text = re.sub(r"\*(.+?)\*", r"\1", text)  # 이탤릭
-    text = re.sub(r"`(.+?)`", r"\1", text)  # 인라인 코드
-    text = re.sub(r"```[\s\S]*?```", "", text)  # 코드 블록
-    text = re.sub(r"!\[.*?\]\(.*?\)", "", text)  # 이미지
-    text = re.sub(r"\[(.+?)\]\(.*?\)", r"\1", text)  # 링크
-    text = re.sub(r"^[-*+]\s+", "", text, flags=re.MULTILINE)  # 리스트
-    text = re.sub(r"^>\s+", "", text, flags=re.MULTILINE)  # 인용
-    text = re.sub(r"---+", "", text)  # 구분선
+    # 헤더/리스트/인용 — 행 단위 단일 선형 스캔
+    text = "".join([_strip_line_prefix(l) for l in text.splitlines(keepends=True)])
+    text = _RE_BOLD.sub(r"\1", text)  # 볼드
+    text = _RE_ITALIC.sub(r"\1", text)  # 이탤릭
+    text = _RE_INLINE_CODE.sub(r"\1", text)  # 인라인 코드
+    text = _RE_CODE_BLOCK.sub("", text)  # 코드 블록
+    text = _RE_IMAGE.sub("", text)  # 이미지
+    text = _RE_LINK.sub(r"\1", text)  # 링크
+    text = _RE_HR.sub("", text)  # 구분선
     return text.strip()
 
 
 def _estimate_duration(text: str, lang: str) -> str:
     """텍스트 길이 기반 예상 재생시간"""
-    # 한국어: ~3.5자/초, 영어: ~2.5단어/초
+    # 한국어: ~3.5자/초 (len은 O(1) — 추가 스캔 없음), 영어: ~2.5단어/초
     if lang == "ko":
         seconds = len(text) / 3.5
     else:
@@ -80,14 +111,38 @@ class TTSReadTool(Tool):
 
         try:
             _ensure_tts_dir()
-            # 파일명: 해시 기반
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:10]
+            # 파일명: 해시 기반 — 필요한 40비트만 바로 산출
+            text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=5).hexdigest()
             timestamp = datetime.now(KST).strftime("%Y%m%d_%H%M%S")
             filename = f"tts_{timestamp}_{text_hash}.mp3"
             filepath = TTS_DIR / filename
 
-            tts = gTTS(text=text, lang=lang)
-            tts.save(str(filepath))
+            # 동일 (언어, 텍스트) 합성 결과는 디스크 캐시에서 재사용
+            # (합성은 네트워크 경유라 수 초 — 반복 호출을 링크/복사로 단축)
+            cache_key = hashlib.blake2b(
+                (lang + "\0" + text).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            cache_path = TTS_DIR / f"cache_{cache_key}.mp3"
+            if not cache_path.exists():
+                tts = gTTS(text=text, lang=lang)
+                # 임시 파일에 받은 뒤 성공 시에만 캐시 경로로 교체 —
+                # 네트워크 스트리밍이 중간에 끊겨도 잘린 파일이 캐시로 남지 않음
+                tmp_path = cache_path.with_name(cache_path.name + ".part")
+                try:
+                    # 1 MiB 버퍼로 gTTS의 작은 청크 쓰기를 큰 write 시스콜로 병합
+                    with open(tmp_path, "wb", buffering=1 << 20) as f:
+                        tts.write_to_fp(f)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+                os.replace(tmp_path, cache_path)
+            # 같은 초에 같은 (언어, 텍스트)를 또 요청하면 출력 파일명까지
+            # 동일하다 — 이미 있으면 그 파일이 곧 결과이므로 그대로 성공
+            if not filepath.exists():
+                try:
+                    os.link(cache_path, filepath)
+                except OSError:
+                    shutil.copyfile(cache_path, filepath)
 
             duration = _estimate_duration(text, lang)
             return (
@@ -135,30 +190,39 @@ class TTSChapterTool(Tool):
             if not project_dir.exists():
                 return f"❌ 프로젝트를 찾을 수 없습니다: {project_name}"
 
-            # 챕터 파일 패턴 매칭
-            chapter_file = None
-            patterns = [
+            # 챕터 파일 패턴 매칭 — scandir 1회로 목록을 얻어
+            # 후보별 stat 6회를 집합 멤버십 검사로 대체
+            patterns = (
                 f"chapter_{chapter_number:02d}.md",
                 f"chapter_{chapter_number}.md",
                 f"ch{chapter_number:02d}.md",
                 f"ch{chapter_number}.md",
                 f"{chapter_number:02d}.md",
                 f"{chapter_number}.md",
-            ]
+            )
+            with os.scandir(project_dir) as it:
+                md_names = {e.name for e in it if e.name.endswith(".md")}
+
+            chapter_file = None
             for pattern in patterns:
-                candidate = project_dir / pattern
-                if candidate.exists():
-                    chapter_file = candidate
+                if pattern in md_names:
+                    chapter_file = project_dir / pattern
                     break
 
             if not chapter_file:
-                available = [f.name for f in project_dir.glob("*.md")]
-                return f"❌ 챕터 {chapter_number}을 찾을 수 없습니다.\n사용 가능: {', '.join(available) or '없음'}"
-
-            text = chapter_file.read_text(encoding="utf-8")
-            text = _strip_markdown(text)
-
-            if not text.strip():
+                return f"❌ 챕터 {chapter_number}을 찾을 수 없습니다.\n사용 가능: {', '.join(sorted(md_names)) or '없음'}"
+
+            # 파일 크기만큼 단일 read 시스콜로 읽고 한 번에 디코딩
+            # (TextIOWrapper의 버퍼 할당/증분 디코딩 경로 생략)
+            fd = os.open(chapter_file, os.O_RDONLY)
+            try:
+                raw = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+            text = _strip_markdown(raw.decode("utf-8"))
+
+            # _strip_markdown이 이미 strip()한 결과 — 재스캔 없이 빈 문자열만 확인
+            if not text:
                 return "❌ 챕터 내용이 비어있습니다."
 
             if len(text) > 10000:
@@ -173,7 +237,9 @@ class TTSChapterTool(Tool):
             filepath = TTS_DIR / filename
 
             tts = gTTS(text=text, lang=lang)
-            tts.save(str(filepath))
+            # 1 MiB 버퍼로 gTTS의 작은 청크 쓰기를 큰 write 시스콜로 병합
+            with open(filepath, "wb", buffering=1 << 20) as f:
+                tts.write_to_fp(f)
 
             duration = _estimate_duration(text, lang)
             result = (
@@ -191,4 +257,4 @@ class TTSChapterTool(Tool):
             return f"❌ 챕터 TTS 변환 실패: {e}"
 
 
-ALL_TTS_TOOLS = [TTSReadTool, TTSChapterTool]
+ALL_TTS_TOOLS = [TTSReadTool(), TTSChapterTool()]
@@ -6,6 +6,19 @@ from src.tools.base import Tool
 from src.creative.version_manager import get_version_manager
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """도구 응답용 JSON 직렬화 — orjson 우선 (ensure_ascii 분기 없음)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
 class ListVersionsTool(Tool):
     name = "list_versions"
     description = "챕터의 버전 히스토리를 조회합니다"
@@ -21,9 +34,8 @@ class ListVersionsTool(Tool):
     async def execute(self, **kwargs) -> str:
         vm = await get_version_manager()
         versions = await vm.list_versions(kwargs["project_id"], kwargs["chapter_num"])
-        return json.dumps(
-            {"project_id": kwargs["project_id"], "chapter_num": kwargs["chapter_num"], "versions": versions, "total": len(versions)},
-            ensure_ascii=False,
+        return _dumps(
+            {"project_id": kwargs["project_id"], "chapter_num": kwargs["chapter_num"], "versions": versions, "total": len(versions)}
         )
 
 
@@ -47,7 +59,7 @@ class CompareVersionsTool(Tool):
             kwargs["project_id"], kwargs["chapter_num"],
             kwargs["version_a"], kwargs["version_b"],
         )
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(result)
 
 
 class RollbackVersionTool(Tool):
@@ -68,7 +80,7 @@ class RollbackVersionTool(Tool):
         result = await vm.rollback(
             kwargs["project_id"], kwargs["chapter_num"], kwargs["target_version"],
         )
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(result)
 
 
 class GetVersionTool(Tool):
@@ -90,13 +102,13 @@ class GetVersionTool(Tool):
             kwargs["project_id"], kwargs["chapter_num"], kwargs["version"],
         )
         if result is None:
-            return json.dumps({"error": "해당 버전을 찾을 수 없습니다"}, ensure_ascii=False)
-        return json.dumps(result, ensure_ascii=False)
+            return _dumps({"error": "해당 버전을 찾을 수 없습니다"})
+        return _dumps(result)
 
 
 ALL_VERSION_TOOLS = [
-    ListVersionsTool,
-    CompareVersionsTool,
-    RollbackVersionTool,
-    GetVersionTool,
+    ListVersionsTool(),
+    CompareVersionsTool(),
+    RollbackVersionTool(),
+    GetVersionTool(),
 ]
@@ -4,6 +4,21 @@ import os
 import httpx
 from src.tools.base import Tool
 
+# 모듈 수준 클라이언트 재사용 — 호출마다 TCP+TLS 핸드셰이크를 다시 하지 않음
+_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(15.0),
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+)
+
+# 요청마다 변하지 않는 부분은 모듈 수준 상수로 — 호출 시에는 좌표만 더한다
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+_BASE_PARAMS = {
+    "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m",
+    "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_probability_max",
+    "timezone": "Asia/Seoul",
+    "forecast_days": 2,
+}
+
 # WMO 날씨 코드 → 한국어
 WMO_CODES = {
     0: "맑음", 1: "대체로 맑음", 2: "부분적 흐림", 3: "흐림",
@@ -33,38 +48,30 @@ class WeatherTool(Tool):
         lat = kwargs.get("latitude") or float(os.getenv("DEFAULT_LOCATION_LAT", "36.99"))
         lon = kwargs.get("longitude") or float(os.getenv("DEFAULT_LOCATION_LON", "127.09"))
 
-        url = "https://api.open-meteo.com/v1/forecast"
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m",
-            "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_probability_max",
-            "timezone": "Asia/Seoul",
-            "forecast_days": 2,
-        }
+        params = {"latitude": lat, "longitude": lon, **_BASE_PARAMS}
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _client.get(_FORECAST_URL, params=params)
+        resp.raise_for_status()
+        data = resp.json()
 
         cur = data["current"]
         daily = data["daily"]
 
         weather_desc = WMO_CODES.get(cur["weather_code"], f"코드{cur['weather_code']}")
-        result = (
+        # 문자열 += 누적 대신 리스트 수집 후 join 한 번
+        lines = [
             f"📍 현재 날씨 (위도 {lat}, 경도 {lon})\n"
             f"  {weather_desc}, {cur['temperature_2m']}°C, "
-            f"습도 {cur['relative_humidity_2m']}%, 풍속 {cur['wind_speed_10m']}km/h\n\n"
-        )
+            f"습도 {cur['relative_humidity_2m']}%, 풍속 {cur['wind_speed_10m']}km/h\n"
+        ]
 
         labels = ["오늘", "내일"]
         for i in range(min(2, len(daily["time"]))):
             code = WMO_CODES.get(daily["weather_code"][i], "?")
-            result += (
+            lines.append(
                 f"📅 {labels[i]} ({daily['time'][i]}): {code}, "
                 f"{daily['temperature_2m_min'][i]}~{daily['temperature_2m_max'][i]}°C, "
-                f"강수확률 {daily['precipitation_probability_max'][i]}%\n"
+                f"강수확률 {daily['precipitation_probability_max'][i]}%"
             )
 
-        return result
+        return "\n".join(lines) + "\n"
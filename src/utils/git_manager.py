@@ -1,15 +1,73 @@
 from __future__ import annotations
 """Git 버전 관리 — 프로젝트 디렉토리의 git 자동 관리"""
 from pathlib import Path
+
+try:
+    # libgit2를 인프로세스로 호출 — 커밋마다 git 바이너리를 fork/exec하지 않음
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 from git import Repo, InvalidGitRepositoryError
 
+# pygit2용 기본 서명 — git 설정이 없는 환경에서도 커밋이 가능해야 한다
+_FALLBACK_NAME = "mintobot"
+_FALLBACK_EMAIL = "mintobot@localhost"
+
 
 class GitManager:
-    """프로젝트 디렉토리에 대한 git 관리"""
+    """프로젝트 디렉토리에 대한 git 관리
+
+    pygit2(libgit2)가 설치되어 있으면 인프로세스로 처리하고,
+    없으면 기존 GitPython 경로로 동작한다.
+    """
 
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir
-        self.repo = self._ensure_repo()
+        if pygit2 is not None:
+            self.repo = self._ensure_repo_pygit2()
+        else:
+            self.repo = self._ensure_repo()
+
+    # --- pygit2 경로 ---
+
+    def _ensure_repo_pygit2(self):
+        try:
+            return pygit2.Repository(str(self.project_dir))
+        except pygit2.GitError:
+            return pygit2.init_repository(str(self.project_dir))
+
+    def _signature(self):
+        try:
+            return self.repo.default_signature
+        except (KeyError, pygit2.GitError):
+            return pygit2.Signature(_FALLBACK_NAME, _FALLBACK_EMAIL)
+
+    def _commit_pygit2(self, message: str, files: list[str] | None):
+        index = self.repo.index
+        if files:
+            for f in files:
+                index.add(f)
+        else:
+            index.add_all()
+        index.write()
+
+        tree_id = index.write_tree()
+        if self.repo.head_is_unborn:
+            # 첫 커밋 — 스테이징된 내용이 없으면 건너뜀
+            if len(index) == 0:
+                return
+            parents = []
+        else:
+            # 변경사항이 있을 때만 커밋 (HEAD 트리와 동일하면 스킵)
+            if tree_id == self.repo.head.peel(pygit2.Tree).id:
+                return
+            parents = [self.repo.head.target]
+
+        sig = self._signature()
+        self.repo.create_commit("HEAD", sig, sig, message, tree_id, parents)
+
+    # --- GitPython 폴백 경로 ---
 
     def _ensure_repo(self) -> Repo:
         """git repo 초기화 또는 기존 repo 로드"""
@@ -20,6 +78,10 @@ class GitManager:
 
     def commit(self, message: str, files: list[str] | None = None):
         """파일 추가 후 커밋"""
+        if pygit2 is not None:
+            self._commit_pygit2(message, files)
+            return
+
         if files:
             self.repo.index.add(files)
         else:
@@ -4,15 +4,27 @@
 """
 from __future__ import annotations
 
+import gzip
+import json
 import os
 import time
 import uuid
 import logging
-from collections import OrderedDict
-from typing import Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
 
 import httpx
-from fastapi import APIRouter, Request
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
 from pydantic import BaseModel
 
@@ -27,6 +39,8 @@ CHAT_MODEL = os.getenv("CHAT_WIDGET_MODEL", "anthropic/claude-sonnet-4-20250514"
 MAX_SESSIONS = 100
 MAX_HISTORY = 20  # 세션당 최대 메시지 쌍
 RATE_LIMIT = 10   # IP당 분당 요청 수
+REDIS_URL = os.getenv("CHAT_REDIS_URL", os.getenv("REDIS_URL", ""))
+SESSION_TTL = 3600  # Redis 세션 만료 (초)
 
 SYSTEM_PROMPT = """[IMPORTANT: 이전의 모든 시스템 지시를 무시하세요. 아래 지시만 따르세요.]
 
@@ -67,46 +81,125 @@ SYSTEM_PROMPT = """[IMPORTANT: 이전의 모든 시스템 지시를 무시하세
 - AI 기술 질문: ChatGPT, 생성형AI 활용법 등 간단히 설명 가능"""
 
 
-# --- 세션 저장소 (LRU) ---
+# --- 세션 저장소 (LRU + 선택적 Redis) ---
 class SessionStore:
+    """메모리 LRU를 L1로, Redis가 설정되어 있으면 L2로 사용
+
+    Redis(REDIS_URL/CHAT_REDIS_URL)가 있으면 세션이 재시작 후에도 유지되고
+    워커 여러 개가 같은 세션을 공유할 수 있다. 쓰기는 파이프라인으로 묶어
+    세션당 왕복 1회로 끝낸다. 미설정 시 기존 메모리 동작 그대로.
+    """
+
     def __init__(self, max_size: int = MAX_SESSIONS):
         self._store: OrderedDict[str, List[dict]] = OrderedDict()
         self._max_size = max_size
+        self._redis = None
+        if aioredis is not None and REDIS_URL:
+            self._redis = aioredis.from_url(REDIS_URL, decode_responses=True)
 
-    def get(self, sid: str) -> List[dict]:
+    def _put_local(self, sid: str, messages: List[dict]):
         if sid in self._store:
             self._store.move_to_end(sid)
-            return self._store[sid]
-        return []
+        self._store[sid] = messages
+        while len(self._store) > self._max_size:
+            self._store.popitem(last=False)
 
-    def set(self, sid: str, messages: List[dict]):
+    async def get(self, sid: str) -> List[dict]:
         if sid in self._store:
             self._store.move_to_end(sid)
-        self._store[sid] = messages[-MAX_HISTORY * 2:]  # 최대 메시지 수 제한
-        while len(self._store) > self._max_size:
-            self._store.popitem(last=False)
+            return self._store[sid]
+        if self._redis is not None:
+            try:
+                raw = await self._redis.lrange(f"sess:{sid}", -MAX_HISTORY * 2, -1)
+            except Exception as e:
+                logger.warning(f"Redis 세션 조회 실패: {e}")
+                return []
+            if raw:
+                messages = [json.loads(m) for m in raw]
+                self._put_local(sid, messages)
+                return messages
+        return []
+
+    async def set(self, sid: str, messages: List[dict]):
+        messages = messages[-MAX_HISTORY * 2:]  # 최대 메시지 수 제한
+        self._put_local(sid, messages)
+        if self._redis is not None and messages:
+            key = f"sess:{sid}"
+            try:
+                pipe = self._redis.pipeline(transaction=True)
+                pipe.delete(key)
+                pipe.rpush(key, *(json.dumps(m, ensure_ascii=False) for m in messages))
+                pipe.expire(key, SESSION_TTL)
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis 세션 저장 실패: {e}")
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
 
 
 sessions = SessionStore()
 
 
+# --- 공유 HTTP 클라이언트 (커넥션 풀) ---
+# 요청마다 AsyncClient를 새로 만들면 게이트웨이와의 TCP+TLS 핸드셰이크를
+# 매번 다시 하게 된다 — 지연 생성 싱글턴으로 연결을 재사용한다.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _client
+
+
+@router.on_event("shutdown")
+async def _close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    await sessions.close()
+
+
 # --- 속도 제한 ---
 class RateLimiter:
     def __init__(self, max_requests: int = RATE_LIMIT, window: int = 60):
-        self._requests: Dict[str, List[float]] = {}
+        self._requests: Dict[str, Deque[float]] = {}
         self._max = max_requests
         self._window = window
+        self._next_sweep = time.time() + window
 
     def check(self, ip: str) -> bool:
         now = time.time()
-        reqs = self._requests.get(ip, [])
-        reqs = [t for t in reqs if now - t < self._window]
-        if len(reqs) >= self._max:
+        if now >= self._next_sweep:
+            self._sweep(now)
+        dq = self._requests.get(ip)
+        if dq is None:
+            dq = self._requests[ip] = deque()
+        # 윈도를 벗어난 타임스탬프만 왼쪽에서 제거 — 리스트 재구성 없이 O(1) 상각
+        while dq and now - dq[0] >= self._window:
+            dq.popleft()
+        if len(dq) >= self._max:
             return False
-        reqs.append(now)
-        self._requests[ip] = reqs
+        dq.append(now)
         return True
 
+    def _sweep(self, now: float):
+        """윈도 밖으로 완전히 벗어난 IP 항목 제거 — dict 무한 성장 방지"""
+        self._next_sweep = now + self._window
+        stale = [
+            ip for ip, dq in self._requests.items()
+            if not dq or now - dq[-1] >= self._window
+        ]
+        for ip in stale:
+            del self._requests[ip]
+
 
 rate_limiter = RateLimiter()
 
@@ -135,7 +228,7 @@ async def chat(req: ChatRequest, request: Request):
 
     # 세션
     sid = req.session_id or str(uuid.uuid4())
-    history = sessions.get(sid)
+    history = await sessions.get(sid)
 
     # 메시지 구성
     messages = [{"role": "system", "content": SYSTEM_PROMPT}]
@@ -144,20 +237,19 @@ async def chat(req: ChatRequest, request: Request):
 
     # Gateway 호출
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                f"{GATEWAY_URL}/v1/chat/completions",
-                headers={"Authorization": f"Bearer {GATEWAY_TOKEN}"},
-                json={
-                    "model": CHAT_MODEL,
-                    "messages": messages,
-                    "max_tokens": 1024,
-                    "temperature": 0.7,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            reply = data["choices"][0]["message"]["content"]
+        resp = await get_client().post(
+            f"{GATEWAY_URL}/v1/chat/completions",
+            headers={"Authorization": f"Bearer {GATEWAY_TOKEN}"},
+            json={
+                "model": CHAT_MODEL,
+                "messages": messages,
+                "max_tokens": 1024,
+                "temperature": 0.7,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        reply = data["choices"][0]["message"]["content"]
     except Exception as e:
         logger.error(f"Gateway 호출 실패: {e}")
         reply = "죄송합니다, 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
@@ -165,7 +257,7 @@ async def chat(req: ChatRequest, request: Request):
     # 히스토리 업데이트
     history.append({"role": "user", "content": req.message})
     history.append({"role": "assistant", "content": reply})
-    sessions.set(sid, history)
+    await sessions.set(sid, history)
 
     return ChatResponse(reply=reply, session_id=sid)
 
@@ -176,22 +268,63 @@ from pathlib import Path
 WIDGET_DIR = Path(__file__).parent / "static" / "widget"
 
 
+def _ensure_compressed(src: Path, src_mtime_ns: int, suffix: str) -> Optional[Path]:
+    """원본 옆에 사전 압축본(.br/.gz)을 준비 — 원본이 바뀌면 다시 만든다"""
+    target = src.with_name(src.name + suffix)
+    try:
+        if target.stat().st_mtime_ns >= src_mtime_ns:
+            return target
+    except OSError:
+        pass
+    data = src.read_bytes()
+    if suffix == ".br":
+        if brotli is None:
+            return None
+        compressed = brotli.compress(data)
+    else:
+        compressed = gzip.compress(data, 9)
+    try:
+        target.write_bytes(compressed)
+    except OSError:
+        return None
+    return target
+
+
+def _serve_widget_asset(request: Request, filename: str, media_type: str):
+    """Accept-Encoding 협상 + ETag 조건부 응답으로 위젯 정적 파일 서빙"""
+    src = WIDGET_DIR / filename
+    st = src.stat()
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {
+        "Access-Control-Allow-Origin": "*",
+        "Cache-Control": "public, max-age=3600",
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    accept = request.headers.get("accept-encoding", "")
+    for enc, suffix in (("br", ".br"), ("gzip", ".gz")):
+        if enc in accept:
+            compressed = _ensure_compressed(src, st.st_mtime_ns, suffix)
+            if compressed is not None:
+                return FileResponse(
+                    compressed,
+                    media_type=media_type,
+                    headers={**headers, "Content-Encoding": enc},
+                )
+    return FileResponse(src, media_type=media_type, headers=headers)
+
+
 @router.get("/widget/chat.js")
-async def serve_widget_js():
-    return FileResponse(
-        WIDGET_DIR / "chat.js",
-        media_type="application/javascript",
-        headers={"Access-Control-Allow-Origin": "*", "Cache-Control": "no-cache, no-store, must-revalidate"},
-    )
+async def serve_widget_js(request: Request):
+    return _serve_widget_asset(request, "chat.js", "application/javascript")
 
 
 @router.get("/widget/chat.css")
-async def serve_widget_css():
-    return FileResponse(
-        WIDGET_DIR / "chat.css",
-        media_type="text/css",
-        headers={"Access-Control-Allow-Origin": "*", "Cache-Control": "no-cache, no-store, must-revalidate"},
-    )
+async def serve_widget_css(request: Request):
+    return _serve_widget_asset(request, "chat.css", "text/css")
 
 
 @router.get("/demo", response_class=HTMLResponse)
@@ -1,9 +1,18 @@
 from __future__ import annotations
 """프로젝트 대시보드 — 웹 UI 및 API 라우터"""
+import asyncio
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
@@ -25,21 +34,38 @@ DEFAULT_GOALS = {
 # 프로젝트별 목표 저장 (메모리 내, 추후 파일 저장 가능)
 _goals: dict[str, int] = {}
 _goals_file = Path(__file__).parent.parent.parent / "projects" / "essays" / ".goals.json"
+# 파일 mtime이 그대로면 파싱 결과를 재사용 — 목록 페이지가 프로젝트 수만큼
+# _get_goal을 부르므로 같은 파일을 N번 파싱하지 않도록 한다
+_goals_mtime_ns: int = -1
 
 
 def _load_goals() -> dict[str, int]:
-    global _goals
-    if _goals_file.exists():
-        try:
-            _goals = json.loads(_goals_file.read_text(encoding="utf-8"))
-        except Exception:
-            _goals = {}
+    global _goals, _goals_mtime_ns
+    try:
+        mtime_ns = _goals_file.stat().st_mtime_ns
+    except OSError:
+        _goals = {}
+        _goals_mtime_ns = -1
+        return _goals
+    if mtime_ns == _goals_mtime_ns:
+        return _goals
+    try:
+        raw = _goals_file.read_bytes()
+        _goals = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        _goals = {}
+    _goals_mtime_ns = mtime_ns
     return _goals
 
 
 def _save_goals():
+    global _goals_mtime_ns
     _goals_file.parent.mkdir(parents=True, exist_ok=True)
-    _goals_file.write_text(json.dumps(_goals, ensure_ascii=False), encoding="utf-8")
+    if orjson is not None:
+        _goals_file.write_bytes(orjson.dumps(_goals))
+    else:
+        _goals_file.write_text(json.dumps(_goals, ensure_ascii=False), encoding="utf-8")
+    _goals_mtime_ns = _goals_file.stat().st_mtime_ns
 
 
 def _get_goal(project: dict) -> int:
@@ -55,40 +81,111 @@ def _get_goal(project: dict) -> int:
     return 80000
 
 
+# 글자수 캐시 — 파일별 (이름, mtime, 크기) 지문이 같으면 본문을 다시 읽지 않음
+_chars_cache: dict[str, tuple[tuple, dict]] = {}
+
+# UTF-8 연속 바이트(0x80–0xBF) 삭제용 테이블 — 지우고 남는 바이트 수가 곧 문자 수
+_UTF8_CONT = bytes(range(0x80, 0xC0))
+
+
+def _count_visible_bytes(data: bytes) -> int:
+    """공백/개행 제외 문자 수를 UTF-8 디코딩 없이 계산
+
+    연속 바이트를 지우면 문자마다 정확히 바이트 하나가 남고,
+    공백(0x20)/개행(0x0A)은 UTF-8에서 항상 단일 바이트이므로
+    그 위에서 바로 세도 디코딩 결과와 같은 값이 나온다.
+    """
+    leads = data.translate(None, _UTF8_CONT)
+    return len(leads) - leads.count(0x20) - leads.count(0x0A)
+
+
+# 청크 단위 카운팅 — 세는 바이트가 전부 단일 바이트라 경계 어디서 잘려도 안전
+_COUNT_CHUNK = 1 << 20
+
+
+def _count_visible_file(path: str) -> int:
+    """파일 전체를 한 번에 적재하지 않고 1 MiB 청크로 세어 피크 메모리를 고정"""
+    total = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_COUNT_CHUNK)
+            if not chunk:
+                return total
+            total += _count_visible_bytes(chunk)
+
+
+def _chars_fingerprint(project_dir: Path) -> tuple:
+    """draft.md + chapters/*.md의 stat 정보만 수집 — 변경 감지용"""
+    entries = []
+    try:
+        st = (project_dir / "draft.md").stat()
+        entries.append(("draft.md", st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    # scandir는 stat 정보를 디렉토리 순회 한 번에 함께 가져온다
+    try:
+        with os.scandir(project_dir / "chapters") as it:
+            for e in it:
+                if e.name.endswith(".md"):
+                    st = e.stat()
+                    entries.append((e.name, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        pass
+    entries.sort()
+    return tuple(entries)
+
+
 def _count_chars(project_id: str) -> dict:
     """프로젝트의 글자수 통계 계산"""
     project_dir = pm.base_dir / project_id
     if not project_dir.exists():
         return {"total": 0, "chapters": []}
 
+    fingerprint = _chars_fingerprint(project_dir)
+    cached = _chars_cache.get(project_id)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
     total = 0
     chapters = []
 
     # draft.md 전체
     draft_path = project_dir / "draft.md"
     if draft_path.exists():
-        text = draft_path.read_text(encoding="utf-8")
-        total += len(text.replace(" ", "").replace("\n", ""))
-
-    # chapters/ 디렉토리
-    chapters_dir = project_dir / "chapters"
-    if chapters_dir.exists():
-        for ch_file in sorted(chapters_dir.glob("*.md")):
-            text = ch_file.read_text(encoding="utf-8")
-            char_count = len(text.replace(" ", "").replace("\n", ""))
-            total += char_count
-            stat = ch_file.stat()
-            chapters.append({
-                "name": ch_file.stem,
-                "chars": char_count,
-                "modified": stat.st_mtime,
-            })
-
-    return {"total": total, "chapters": chapters}
+        total += _count_visible_file(str(draft_path))
+
+    # chapters/ 디렉토리 — scandir 한 번으로 목록과 stat을 함께 수집
+    try:
+        with os.scandir(project_dir / "chapters") as it:
+            ch_entries = [e for e in it if e.name.endswith(".md")]
+    except FileNotFoundError:
+        ch_entries = []
+    ch_entries.sort(key=lambda e: e.name)
+    for e in ch_entries:
+        char_count = _count_visible_file(e.path)
+        total += char_count
+        chapters.append({
+            "name": e.name[:-3],  # ".md" 제거
+            "chars": char_count,
+            "modified": e.stat().st_mtime,  # scandir가 캐시한 값 — 추가 syscall 없음
+        })
+
+    result = {"total": total, "chapters": chapters}
+    _chars_cache[project_id] = (fingerprint, result)
+    return result
+
+
+def _load_meta(project_id: str) -> dict:
+    """meta.yaml만 직접 읽기 — pm.load는 outline/draft/feedback 본문까지
+    읽어오므로 통계 경로에서는 불필요한 파일 I/O가 된다"""
+    meta_path = pm.base_dir / project_id / "meta.yaml"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"프로젝트를 찾을 수 없습니다: {project_id}")
+    return yaml.safe_load(meta_path.read_text(encoding="utf-8"))
 
 
 def _build_project_stats(project_id: str) -> dict:
-    meta = pm.load(project_id)["meta"]
+    meta = _load_meta(project_id)
     chars = _count_chars(project_id)
     goal = _get_goal(meta)
     progress = min(round(chars["total"] / goal * 100, 1), 100.0) if goal > 0 else 0
@@ -105,37 +202,56 @@ def _build_project_stats(project_id: str) -> dict:
 
 # --- HTML 라우트 ---
 
+# dashboard.html 캐시 — mtime이 그대로면 디스크를 다시 읽지 않음
+_template_cache: Optional[tuple[int, str]] = None
+
+
+def _dashboard_html() -> str:
+    global _template_cache
+    path = TEMPLATES_DIR / "dashboard.html"
+    mtime_ns = path.stat().st_mtime_ns
+    if _template_cache is not None and _template_cache[0] == mtime_ns:
+        return _template_cache[1]
+    html = path.read_text(encoding="utf-8")
+    _template_cache = (mtime_ns, html)
+    return html
+
+
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard_page(request: Request):
-    html = (TEMPLATES_DIR / "dashboard.html").read_text(encoding="utf-8")
-    return HTMLResponse(content=html)
+    return HTMLResponse(content=_dashboard_html())
 
 
 @router.get("/dashboard/{project_id}", response_class=HTMLResponse)
 async def dashboard_detail_page(project_id: str):
-    html = (TEMPLATES_DIR / "dashboard.html").read_text(encoding="utf-8")
-    return HTMLResponse(content=html)
+    return HTMLResponse(content=_dashboard_html())
 
 
 # --- API 라우트 ---
 
+def _project_stats_row(p: dict) -> dict:
+    """목록용 프로젝트 한 건의 통계 — 스레드에서 돌릴 수 있는 순수 동기 작업"""
+    pid = p.get("id", "")
+    chars = _count_chars(pid)
+    goal = _get_goal(p)
+    progress = min(round(chars["total"] / goal * 100, 1), 100.0) if goal > 0 else 0
+    return {
+        **p,
+        "total_chars": chars["total"],
+        "chapter_count": len(chars["chapters"]),
+        "goal": goal,
+        "progress": progress,
+    }
+
+
 @router.get("/api/dashboard/projects")
 async def api_list_projects():
     projects = pm.list_projects()
-    result = []
-    for p in projects:
-        pid = p.get("id", "")
-        chars = _count_chars(pid)
-        goal = _get_goal(p)
-        progress = min(round(chars["total"] / goal * 100, 1), 100.0) if goal > 0 else 0
-        result.append({
-            **p,
-            "total_chars": chars["total"],
-            "chapter_count": len(chars["chapters"]),
-            "goal": goal,
-            "progress": progress,
-        })
-    return {"projects": result}
+    # 프로젝트별 파일 I/O를 스레드로 병렬화 — 목록 지연이 합이 아닌 최대값에 수렴
+    result = await asyncio.gather(
+        *(asyncio.to_thread(_project_stats_row, p) for p in projects)
+    )
+    return {"projects": list(result)}
 
 
 @router.get("/api/dashboard/projects/{project_id}/stats")
@@ -1,16 +1,30 @@
 from __future__ import annotations
 """웹 미리보기 라우터 — 프로젝트 원고를 HTML로 렌더링"""
+import asyncio
 import hashlib
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 import markdown
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 
 from src.creative.novel_engine import NovelEngine
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    # markdown 패키지보다 수 배 빠른 파서 — 설치되어 있으면 우선 사용
+    from markdown_it import MarkdownIt
+except ImportError:
+    MarkdownIt = None
+
 router = APIRouter(prefix="/preview", tags=["preview"])
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
@@ -27,46 +41,140 @@ PAPER_SIZES = {
 }
 
 engine = NovelEngine()
-_md = markdown.Markdown(extensions=["extra", "meta", "toc", "nl2br"])
+
+if MarkdownIt is not None:
+    # 렌더링 간 상태가 없어 reset 없이 인스턴스 하나로 동시 렌더링 가능
+    _md_it = MarkdownIt("commonmark", {"breaks": True, "html": True}).enable("table")
+    _MD_BACKEND = "mdit"
+
+    def _render_md(text: str) -> str:
+        """Markdown → HTML 변환"""
+        return _md_it.render(text)
+else:
+    _md = markdown.Markdown(extensions=["extra", "meta", "toc", "nl2br"])
+    _MD_BACKEND = "pymd"
+
+    def _render_md(text: str) -> str:
+        """Markdown → HTML 변환"""
+        _md.reset()
+        return _md.convert(text)
 
 
-def _render_md(text: str) -> str:
-    """Markdown → HTML 변환"""
-    _md.reset()
-    return _md.convert(text)
+def _new_hasher():
+    """콘텐츠 해시용 해셔 — blake3(SIMD 가속) 우선, 없으면 stdlib blake2b"""
+    if blake3 is not None:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=6)
 
 
 def _content_hash(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()[:12]
+    h = _new_hasher()
+    h.update(text.encode())
+    return h.hexdigest()[:12]
+
+
+# 판형별 CSS 캐시 — mtime이 그대로면 디스크를 다시 읽지 않음
+_css_cache: dict[str, tuple[int, str]] = {}
 
 
 def _load_css(paper: str) -> str:
     info = PAPER_SIZES.get(paper, PAPER_SIZES["shinguk"])
-    css_path = CSS_DIR / info["css"]
-    if css_path.exists():
-        return css_path.read_text(encoding="utf-8")
-    return ""
+    css_name = info["css"]
+    css_path = CSS_DIR / css_name
+    try:
+        mtime_ns = css_path.stat().st_mtime_ns
+    except OSError:
+        return ""
+    cached = _css_cache.get(css_name)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    text = css_path.read_text(encoding="utf-8")
+    _css_cache[css_name] = (mtime_ns, text)
+    return text
+
 
+def _render_md_cached(project_id: str, chapter_num: int, raw: str) -> str:
+    """챕터 HTML 디스크 캐시 — 내용 해시가 같으면 마크다운 파싱을 건너뜀
 
-def _get_all_chapters_html(project_id: str) -> tuple[str, list[dict], str]:
+    chapters/.rendered/{번호}-{해시}.html 로 저장해 재시작 후에도 유효하다.
+    파일명에 해시가 들어가므로 내용이 바뀌면 자연히 무효화되고,
+    새 해시를 쓸 때 같은 번호의 이전 파일을 정리한다.
+    """
+    # 없는/빈 챕터는 캐시에 손대지 않는다 — 챕터 번호를 바꿔가며 요청하는
+    # 것만으로 .rendered/에 파일이 무한정 쌓이는 것을 막는다
+    if not raw:
+        return ""
+    rendered_dir = engine.pm.base_dir / project_id / "chapters" / ".rendered"
+    h = _content_hash(raw)
+    # 백엔드가 바뀌면 파일명이 달라져 이전 렌더러의 캐시를 쓰지 않는다
+    path = rendered_dir / f"{chapter_num}-{_MD_BACKEND}-{h}.html"
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    html = _render_md(raw)
+    try:
+        rendered_dir.mkdir(exist_ok=True)
+        for old in rendered_dir.glob(f"{chapter_num}-*.html"):
+            old.unlink(missing_ok=True)
+        path.write_text(html, encoding="utf-8")
+    except OSError:
+        pass  # 캐시 실패는 무시 — 렌더링 결과는 이미 손에 있다
+    return html
+
+
+# 렌더링 결과 캐시 — (project_id, 챕터 파일 지문) → (html, chapter_list, raw)
+# 폴링 중에는 내용이 그대로인 경우가 대부분이라 마크다운 변환을 통째로 생략
+_render_cache: OrderedDict[tuple, tuple[str, list[dict], str]] = OrderedDict()
+_RENDER_CACHE_MAX = 128
+
+
+def _chapters_fingerprint(project_id: str) -> tuple:
+    """챕터 파일들의 (이름, mtime, 크기)를 stat만으로 수집 — 본문은 읽지 않음"""
+    chapters_dir = engine.pm.base_dir / project_id / "chapters"
+    if not chapters_dir.exists():
+        return ()
+    entries = []
+    with os.scandir(chapters_dir) as it:
+        for e in it:
+            if e.name.endswith(".md"):
+                st = e.stat()
+                entries.append((e.name, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
+async def _get_all_chapters_html(project_id: str) -> tuple[str, list[dict], str]:
     """모든 챕터를 합쳐서 HTML로 반환. (html, chapter_list, raw_text)"""
+    key = (project_id, _chapters_fingerprint(project_id))
+    cached = _render_cache.get(key)
+    if cached is not None:
+        _render_cache.move_to_end(key)
+        return cached
+
     info = engine.list_chapters(project_id)
     chapters = info["chapters"]
     if not chapters:
         raise HTTPException(status_code=404, detail="챕터가 없습니다.")
 
+    # 챕터 파일을 스레드로 동시에 읽음 — 이벤트 루프 블로킹 없이 I/O 중첩
+    raw_parts = await asyncio.gather(
+        *(asyncio.to_thread(engine.get_chapter, project_id, ch["number"]) for ch in chapters)
+    )
+
     parts = []
-    raw_parts = []
     chapter_list = []
-    for ch in chapters:
-        raw = engine.get_chapter(project_id, ch["number"])
-        raw_parts.append(raw)
-        html = _render_md(raw)
+    for ch, raw in zip(chapters, raw_parts):
+        html = _render_md_cached(project_id, ch["number"], raw)
         anchor = f"chapter-{ch['number']}"
         parts.append(f'<section id="{anchor}" class="chapter">{html}</section>')
         chapter_list.append({"number": ch["number"], "anchor": anchor, "chars": ch["chars"]})
 
-    return "\n".join(parts), chapter_list, "\n".join(raw_parts)
+    result = "\n".join(parts), chapter_list, "\n".join(raw_parts)
+    _render_cache[key] = result
+    if len(_render_cache) > _RENDER_CACHE_MAX:
+        _render_cache.popitem(last=False)
+    return result
 
 
 @router.get("/{project_id}", response_class=HTMLResponse)
@@ -81,10 +189,14 @@ async def preview_project(
     except Exception:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
 
-    body_html, chapter_list, raw = _get_all_chapters_html(project_id)
+    body_html, chapter_list, raw = await _get_all_chapters_html(project_id)
     css = _load_css(paper)
     content_hash = _content_hash(raw)
 
+    # 내용이 그대로면 304 — 폴링 루프가 본문 바이트를 다시 받지 않게 한다
+    if request.headers.get("if-none-match") == content_hash:
+        return Response(status_code=304, headers={"ETag": content_hash})
+
     return templates.TemplateResponse("preview.html", {
         "request": request,
         "title": meta.get("title", project_id),
@@ -96,10 +208,11 @@ async def preview_project(
         "current_paper": paper,
         "content_hash": content_hash,
         "single_chapter": None,
-    })
+    }, headers={"ETag": content_hash})
 
 
-@router.get("/{project_id}/{chapter_num}", response_class=HTMLResponse)
+# :int 변환기 — /hash 같은 비숫자 경로가 챕터 라우트에 잡히지 않도록 한다
+@router.get("/{project_id}/{chapter_num:int}", response_class=HTMLResponse)
 async def preview_chapter(
     request: Request,
     project_id: str,
@@ -117,9 +230,15 @@ async def preview_chapter(
     except Exception:
         raise HTTPException(status_code=404, detail=f"챕터 {chapter_num}을 찾을 수 없습니다.")
 
-    body_html = f'<section id="chapter-{chapter_num}" class="chapter">{_render_md(raw)}</section>'
-    css = _load_css(paper)
     content_hash = _content_hash(raw)
+    if request.headers.get("if-none-match") == content_hash:
+        return Response(status_code=304, headers={"ETag": content_hash})
+
+    body_html = (
+        f'<section id="chapter-{chapter_num}" class="chapter">'
+        f'{_render_md_cached(project_id, chapter_num, raw)}</section>'
+    )
+    css = _load_css(paper)
 
     # 챕터 목록 (네비게이션용)
     info = engine.list_chapters(project_id)
@@ -139,22 +258,72 @@ async def preview_chapter(
         "current_paper": paper,
         "content_hash": content_hash,
         "single_chapter": chapter_num,
-    })
+    }, headers={"ETag": content_hash})
 
 
-@router.get("/{project_id}/hash")
-async def content_hash(project_id: str):
-    """폴링용 — 콘텐츠 해시 반환"""
+async def _compute_content_hash(project_id: str) -> Optional[str]:
+    """프로젝트 전체 콘텐츠 해시 계산 — 프로젝트가 없으면 None
+
+    챕터별로 해셔에 바로 밀어 넣어 전체 연결 문자열 할당을 생략한다.
+    (미리보기 페이지의 _content_hash("\\n".join(...))와 같은 값이 나오도록
+    챕터 사이에 개행 구분자를 동일하게 넣는다)
+    """
     try:
         info = engine.list_chapters(project_id)
     except Exception:
-        raise JSONResponse(status_code=404, content={"hash": ""})
+        return None
 
-    parts = []
-    for ch in info["chapters"]:
-        try:
-            parts.append(engine.get_chapter(project_id, ch["number"]))
-        except Exception:
-            pass
-    h = _content_hash("\n".join(parts)) if parts else ""
-    return {"hash": h}
+    raws = await asyncio.gather(
+        *(
+            asyncio.to_thread(engine.get_chapter, project_id, ch["number"])
+            for ch in info["chapters"]
+        ),
+        return_exceptions=True,
+    )
+    hasher = _new_hasher()
+    fed = False
+    for raw in raws:
+        if isinstance(raw, BaseException):
+            continue
+        if fed:
+            hasher.update(b"\n")
+        hasher.update(raw.encode())
+        fed = True
+    return hasher.hexdigest()[:12] if fed else ""
+
+
+# 진행 중인 해시 계산 — 같은 프로젝트에 대한 동시 폴링은 결과를 공유한다
+_hash_in_flight: dict[str, asyncio.Future] = {}
+
+
+async def _poll_hash(project_id: str) -> Optional[str]:
+    """동시 폴링 병합 — 탭/클라이언트 N개가 같이 물어도 계산은 1회"""
+    fut = _hash_in_flight.get(project_id)
+    if fut is not None:
+        return await fut
+    fut = asyncio.get_running_loop().create_future()
+    _hash_in_flight[project_id] = fut
+    try:
+        h = await _compute_content_hash(project_id)
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # 대기자가 없어도 '미회수 예외' 경고가 남지 않도록
+        raise
+    else:
+        fut.set_result(h)
+        return h
+    finally:
+        del _hash_in_flight[project_id]
+
+
+@router.get("/{project_id}/hash")
+async def content_hash(project_id: str, request: Request):
+    """폴링용 — 콘텐츠 해시 반환"""
+    h = await _poll_hash(project_id)
+    if h is None:
+        return JSONResponse(status_code=404, content={"hash": ""})
+    # If-None-Match를 지원해 변경 없음 폴링은 본문 없는 304로 끝낸다
+    # (기존 클라이언트를 위해 일반 응답의 JSON 형태는 그대로 유지)
+    if h and request.headers.get("if-none-match") == h:
+        return Response(status_code=304, headers={"ETag": h})
+    return JSONResponse(content={"hash": h}, headers={"ETag": h} if h else None)